@@ -4,70 +4,270 @@ Advanced HWP MCP Server
 고도화된 한글 MCP 서버 - 한글의 모든 기능을 제어할 수 있는 MCP 서버
 """
 
+import asyncio
+import atexit
+import csv
+import functools
+import io
 import logging
+import queue
 import sys
 import os
+import ntpath
 import re
-from typing import Optional, Dict, Any, List, Tuple
-import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import List, Optional
 
 try:
     from mcp.server.fastmcp import FastMCP
     import win32com.client
     import pythoncom
-    import win32api
     import win32con
     import win32gui
     import win32process
     import ctypes
+    import ctypes.wintypes
 except ImportError as e:
     print(f"필수 패키지가 설치되지 않음: {e}", file=sys.stderr)
     print("다음 명령어로 패키지를 설치하세요:", file=sys.stderr)
     print("pip install mcp fastmcp pywin32", file=sys.stderr)
     sys.exit(1)
 
+from hwp_text import find_positions, multi_replace, scan_headings, text_stats
+
 # 로깅 설정 - MCP는 stdout을 JSON-RPC로 사용하므로 stderr로만 출력
+# 파일/스트림 출력은 QueueListener 스레드에서 처리해 도구 호출 스레드가 I/O를 기다리지 않게 합니다
+# 로그 파일은 MemoryHandler로 모아서 쓰고, ERROR 이상이 오면 즉시 기록합니다
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_file_handler = logging.FileHandler('hwp_mcp.log')
+_log_file_handler.setFormatter(_log_formatter)
+_log_stream_handler = logging.StreamHandler(sys.stderr)
+_log_stream_handler.setFormatter(_log_formatter)
+_log_file_buffer = MemoryHandler(256, flushLevel=logging.ERROR, target=_log_file_handler)
+
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _log_file_buffer, _log_stream_handler)
+_log_listener.start()
+
+def _stop_logging():
+    """남은 로그 레코드를 처리하고 버퍼에 모인 내용을 파일에 씁니다."""
+    _log_listener.stop()
+    _log_file_buffer.flush()
+
+atexit.register(_stop_logging)
+
+# QueueHandler는 메시지 본문만 만들고, 시각/레벨 서식은 리스너 쪽 핸들러가 붙임
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('hwp_mcp.log'),
-        logging.StreamHandler(sys.stderr)
-    ]
+    format='%(message)s',
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
 # MCP 서버 초기화
 mcp = FastMCP("Advanced HWP Server")
 
+# 한글 COM 객체 ProgID
+HWP_PROGID = "HWPFrame.HwpObject"
+
+# 호스트가 이미 COM을 초기화한 경우 HWP_MCP_SKIP_COINIT=1로 초기화를 건너뜁니다
+_SKIP_COINIT = os.environ.get("HWP_MCP_SKIP_COINIT") == "1"
+_com_tls = threading.local()
+
+def _ensure_com():
+    """현재 스레드의 COM을 한 번만 초기화합니다."""
+    if _SKIP_COINIT or getattr(_com_tls, 'inited', False):
+        return
+    try:
+        pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+    except pythoncom.com_error:
+        # 다른 모드로 이미 초기화된 스레드 (RPC_E_CHANGED_MODE)
+        pass
+    _com_tls.inited = True
+
+# 한글 COM 호출은 모두 이 단일 STA 작업 스레드에서 실행됩니다.
+# 이벤트 루프는 COM 호출이 진행되는 동안에도 다른 요청을 처리할 수 있습니다.
+_HWP_POOL = ThreadPoolExecutor(max_workers=1, initializer=_ensure_com, thread_name_prefix="hwp-com")
+
+# 백그라운드 작업: 작업 ID -> [작업 이름, 작업 스레드 future, 완료 시각]
+_JOBS = {}
+# 끝난 작업을 조회하지 않아도 목록에 남겨 두는 시간 (초)
+_JOB_TTL = 600.0
+
+def _prune_jobs():
+    """끝난 지 _JOB_TTL초가 지난 작업을 목록에서 제거합니다."""
+    now = time.monotonic()
+    for job_id, job in list(_JOBS.items()):
+        finished_at = job[2]
+        if finished_at is not None and now - finished_at > _JOB_TTL:
+            _JOBS.pop(job_id, None)
+
+def _submit_job(name, fn, *args):
+    """
+    fn을 한글 작업 스레드에 예약하고 작업 ID 안내 문구를 바로 반환합니다.
+    작업은 이미 예약된 한글 작업 뒤에 순서대로 실행됩니다.
+    """
+    _prune_jobs()
+
+    job_id = uuid.uuid4().hex[:8]
+    job = [name, _HWP_POOL.submit(fn, *args), None]
+
+    def _mark_done(_future, job=job):
+        job[2] = time.monotonic()
+
+    job[1].add_done_callback(_mark_done)
+    _JOBS[job_id] = job
+    logger.info("%s 작업 예약: %s", name, job_id)
+    return f"{name} 작업을 시작했습니다. 작업 ID: {job_id}\nget_job_status(\"{job_id}\")로 진행 상태를 확인하세요."
+
+# 진행 중인 읽기 요청: 키 -> 작업 스레드 future
+_PENDING = {}
+# 문서를 바꿀 수 있는 도구가 실행될 때마다 증가하는 리비전 (읽기 결과 캐시 무효화용)
+_doc_rev = 0
+
+def _run_edit(call):
+    """
+    리비전을 올린 뒤 문서를 바꿀 수 있는 도구를 실행합니다.
+    작업 스레드에서 실행되므로 리비전은 캐시를 읽는 쪽과 같은 순서로 증가합니다.
+    """
+    global _doc_rev
+
+    _doc_rev += 1
+    return call()
+
+def _hwp_tool(coalesce=None, readonly=False):
+    """
+    도구 함수를 MCP에 등록하는 데코레이터입니다.
+    MCP에는 작업 스레드에서 함수를 실행하는 async 래퍼가 등록되고,
+    모듈에는 원래의 동기 함수가 그대로 남습니다.
+
+    Args:
+        coalesce: 도구 인자로부터 요청 키를 만드는 함수. 지정하면 같은 키의
+            요청이 진행 중일 때 새로 실행하지 않고 그 결과를 함께 기다립니다.
+        readonly: 문서 내용을 바꾸지 않는 도구. coalesce를 지정한 도구도 읽기 전용입니다.
+    """
+    readonly = readonly or coalesce is not None
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def runner(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            call = functools.partial(fn, *args, **kwargs)
+
+            if not readonly:
+                # 문서가 바뀔 수 있으므로 이후 읽기 요청은 진행 중인 결과나 캐시를 재사용하지 않습니다
+                _PENDING.clear()
+                call = functools.partial(_run_edit, call)
+
+            if coalesce is None:
+                return await loop.run_in_executor(_HWP_POOL, call)
+
+            key = coalesce(*args, **kwargs)
+            future = _PENDING.get(key)
+            if future is None:
+                future = loop.run_in_executor(_HWP_POOL, call)
+                _PENDING[key] = future
+
+                def _release(done, key=key):
+                    if _PENDING.get(key) is done:
+                        del _PENDING[key]
+
+                future.add_done_callback(_release)
+            return await asyncio.shield(future)
+
+        mcp.tool()(runner)
+        return fn
+    return decorator
+
+def _early_bind(hwp):
+    """
+    late-bound 한글 객체를 gencache로 생성된 early-bound 래퍼로 변환합니다.
+    타입 라이브러리 모듈은 gen_py에 한 번만 생성되고 이후에는 재사용됩니다.
+    """
+    try:
+        return win32com.client.gencache.EnsureDispatch(hwp)
+    except Exception:
+        return hwp
+
+# 첫 EnsureDispatch 이후의 한글 CLSID. gen_py 래퍼가 이미 만들어졌으므로
+# 재초기화 시에는 gencache 조회 없이 CLSID로 바로 생성합니다
+_hwp_clsid = None
+
+# 실행 중인 한글을 찾지 못한 뒤 다시 탐색하기까지의 간격 (초)
+_ACQUIRE_RETRY_INTERVAL = 1.0
+
+def _dispatch_hwp():
+    """한글 COM 객체를 생성합니다. gencache는 처음 한 번만 거칩니다."""
+    global _hwp_clsid
+
+    if _hwp_clsid is not None:
+        return win32com.client.Dispatch(_hwp_clsid)
+
+    try:
+        hwp = win32com.client.gencache.EnsureDispatch(HWP_PROGID)
+    except Exception:
+        # gencache가 실패하면 일반 Dispatch 사용
+        return win32com.client.Dispatch(HWP_PROGID)
+
+    _hwp_clsid = getattr(hwp, "CLSID", None)
+    return hwp
+
+# FilePathCheckerModule을 등록한 한글 객체 (객체마다 한 번만 등록)
+_file_path_check_owner = None
+
+def _register_file_path_check(hwp):
+    """파일 경로 확인 대화상자를 끄는 보안 모듈을 한글 객체마다 한 번만 등록합니다."""
+    global _file_path_check_owner
+
+    if hwp is _file_path_check_owner:
+        return
+    try:
+        hwp.RegisterModule("FilePathCheckDLL", "FilePathCheckerModule")
+    except:
+        return
+    _file_path_check_owner = hwp
+
 class AdvancedHwpController:
     """고급 한글 컨트롤러 클래스"""
     
+    __slots__ = (
+        'hwp',
+        'is_initialized',
+        'current_document',
+        'screen_update_enabled',
+        '_last_miss',
+        'launched',
+    )
+    
     def __init__(self):
         """한글 COM 객체 초기화"""
         self.hwp = None
         self.is_initialized = False
         self.current_document = None
+        self.screen_update_enabled = True
+        # 실행 중인 한글을 찾지 못한 마지막 시각 (acquire 재시도 간격 제한)
+        self._last_miss = 0.0
+        # 마지막 acquire(launch=True)가 한글을 새로 띄웠는지 여부
+        self.launched = False
         
     def initialize(self):
         """한글 COM 객체 초기화"""
         try:
-            pythoncom.CoInitialize()
+            _ensure_com()
 
             # 한글 프로그램이 설치되어 있는지 확인
-            try:
-                self.hwp = win32com.client.gencache.EnsureDispatch("HWPFrame.HwpObject")
-            except:
-                # gencache가 실패하면 일반 Dispatch 사용
-                self.hwp = win32com.client.Dispatch("HWPFrame.HwpObject")
+            self.hwp = _dispatch_hwp()
 
             # ===== 자동화 모드 설정: 모든 확인 대화상자 자동 승인 =====
 
             # 1. 파일 경로 체크 대화상자 비활성화
-            try:
-                self.hwp.RegisterModule("FilePathCheckDLL", "FilePathCheckerModule")
-            except:
-                pass
+            _register_file_path_check(self.hwp)
 
             # 2. 보안 경고 대화상자 비활성화
             try:
@@ -109,28 +309,703 @@ class AdvancedHwpController:
             return True
 
         except Exception as e:
-            logger.error(f"한글 COM 객체 초기화 실패: {e}")
+            logger.error("한글 COM 객체 초기화 실패: %s", e)
             return False
     
-    def __del__(self):
-        """리소스 정리"""
-        try:
-            if self.is_initialized:
+    def shutdown(self):
+        """
+        한글 작업 스레드에서 한글 객체를 놓고 COM을 해제한 뒤 작업 스레드를 종료합니다.
+        한글 객체는 작업 스레드의 아파트먼트에 속하므로 해제도 그 스레드에서 해야 합니다.
+        (atexit 시점에는 작업 스레드가 이미 새 작업을 받지 않으므로 서버 종료 직후에 호출)
+        """
+        def _release():
+            self.reset()
+            if getattr(_com_tls, 'inited', False):
                 pythoncom.CoUninitialize()
+                _com_tls.inited = False
+
+        try:
+            _HWP_POOL.submit(_release).result()
+        except Exception as e:
+            logger.warning("한글 COM 해제 실패: %s", e)
+        _HWP_POOL.shutdown()
+    
+    def acquire(self, launch=False):
+        """
+        한글 객체를 한 번만 연결해 재사용합니다.
+        연결된 객체가 응답하지 않으면 다시 연결하고, 실행 중인 한글이 없으면 None을 반환합니다.
+
+        Args:
+            launch: True면 실행 중인 한글이 없을 때 새로 띄운 인스턴스를 그대로 사용합니다.
+        """
+        self.launched = False
+        if self.hwp is not None:
+            try:
+                self.hwp.Version
+                return self.hwp
+            except Exception:
+                logger.warning("한글 객체가 응답하지 않아 다시 연결합니다.")
+                self.reset()
+
+        # 방금 찾지 못했다면 _ACQUIRE_RETRY_INTERVAL초 동안은 다시 탐색하지 않음
+        if not launch and time.monotonic() - self._last_miss < _ACQUIRE_RETRY_INTERVAL:
+            return None
+
+        _ensure_com()
+
+        hwp = None
+        try:
+            hwp = _early_bind(win32com.client.GetActiveObject(HWP_PROGID))
         except:
             pass
-    
+
+        if hwp is None:
+            try:
+                hwp = _early_bind(win32com.client.Dispatch(HWP_PROGID))
+                if hwp.XHwpDocuments.Count == 0:
+                    if not launch:
+                        # 확인용으로 새로 띄운 인스턴스는 남기지 않음
+                        hwp.Quit()
+                        self._last_miss = time.monotonic()
+                        return None
+                    self.launched = True
+            except:
+                self._last_miss = time.monotonic()
+                return None
+
+        self.hwp = hwp
+        self.is_initialized = True
+        return hwp
+
+    def reset(self):
+        """
+        한글 객체 연결을 해제합니다. 다음 도구 호출에서 다시 초기화되며,
+        이전 객체에서 만든 액션 핸들 캐시도 함께 비웁니다.
+        """
+        self.hwp = None
+        self.is_initialized = False
+        self.current_document = None
+        _check_handle_cache(None)
+
     def check_initialization(self):
-        """초기화 상태 확인"""
+        """초기화 상태를 확인하고 한글 객체를 반환합니다."""
         if not self.is_initialized:
             if not self.initialize():
                 raise Exception("한글 프로그램이 설치되지 않았거나 초기화할 수 없습니다.")
-        return True
+        return self.hwp
+
+# 글꼴 이름을 지정하는 CharShape 항목 (언어별)
+_FACE_KEYS = (
+    "FaceNameHangul",
+    "FaceNameLatin",
+    "FaceNameHanja",
+    "FaceNameJapanese",
+    "FaceNameOther",
+    "FaceNameSymbol",
+    "FaceNameUser",
+)
+
+# 글자 색상 이름 -> 색상 값
+_COLOR_MAP = MappingProxyType({
+    "black": 0x000000,
+    "red": 0xFF0000,
+    "blue": 0x0000FF,
+    "green": 0x00FF00,
+    "yellow": 0xFFFF00,
+    "purple": 0xFF00FF,
+    "cyan": 0x00FFFF
+})
+
+# 문단 정렬 이름 -> Align 값
+_ALIGN_MAP = MappingProxyType({
+    "left": 0,
+    "center": 1,
+    "right": 2,
+    "justify": 3,
+    "distribute": 4
+})
+
+# 도형 이름 -> ShapeType 값
+_SHAPE_MAP = MappingProxyType({
+    "rectangle": 1,
+    "ellipse": 2,
+    "line": 3,
+    "arrow": 4,
+    "textbox": 5
+})
+
+def _lookup_folded(table, key, default):
+    """대소문자 무시 조회. 이미 소문자로 들어온 키는 casefold 없이 바로 찾습니다."""
+    value = table.get(key)
+    if value is None:
+        value = table.get(key.casefold(), default)
+    return value
+
+# 제목 수준 -> 스타일 이름
+_HEADING_STYLE_NAMES = MappingProxyType({level: f"제목 {level}" for level in range(1, 8)})
+
+@functools.lru_cache(maxsize=64)
+def _char_shape_items(font_name, font_size, bold, italic, underline, color):
+    """apply_font_format 인자에 해당하는 CharShape 항목을 한 번만 만들어 재사용합니다."""
+    items = dict.fromkeys(_FACE_KEYS, font_name)
+    items.update(
+        Height=font_size * 100,
+        Bold=bold,
+        Italic=italic,
+        Underline=underline,
+        TextColor=_COLOR_MAP.get(color.casefold(), 0x000000),
+    )
+    return MappingProxyType(items)
 
 # 전역 컨트롤러 인스턴스
 hwp_controller = AdvancedHwpController()
 
-@mcp.tool()
+def _require_hwp():
+    """초기화된 한글 객체를 반환합니다. 초기화되지 않았으면 먼저 초기화합니다."""
+    if hwp_controller.is_initialized:
+        return hwp_controller.hwp
+    return hwp_controller.check_initialization()
+
+def _com_get(obj, name, default=None):
+    """
+    COM 객체의 속성을 한 번만 읽습니다. 속성이 없거나 값이 None(VT_EMPTY)이면 default를 반환합니다.
+    hasattr 후 다시 읽는 방식과 달리 디스패치가 한 번뿐입니다.
+    """
+    value = getattr(obj, name, None)
+    return default if value is None else value
+
+# 액션 이름 -> (Action, ParameterSet) 캐시
+# 같은 액션은 항상 같은 항목을 채워 실행하므로 ParameterSet을 그대로 재사용합니다
+_ACTION_CACHE = {}
+# 액션 이름 -> HParameterSet 기반 핸들 캐시 (GetDefault는 처음 한 번만)
+_PSET_CACHE = {}
+# 액션 이름 -> 마지막 _invoke_action 호출에서 설정한 항목과 값
+_ACTION_ITEMS = {}
+_handle_cache_owner = None
+
+def _check_handle_cache(hwp):
+    """캐시된 COM 핸들이 현재 한글 객체의 것인지 확인하고, 바뀌었으면 비웁니다."""
+    global _handle_cache_owner
+
+    if hwp is not _handle_cache_owner:
+        _ACTION_CACHE.clear()
+        _PSET_CACHE.clear()
+        _ACTION_ITEMS.clear()
+        _handle_cache_owner = hwp
+
+# 대화상자 모드 설정 함수 캐시: (한글 객체, 설정 함수)
+_message_box_setter = (None, None)
+
+def _set_message_box_mode(hwp, mode):
+    """
+    대화상자 모드를 설정합니다. 한글 버전에 따라 SetMessageBoxMode 메서드 또는 MessageBoxMode 속성을 쓰며,
+    어느 쪽인지는 한글 객체마다 처음 한 번만 확인합니다.
+    """
+    global _message_box_setter
+
+    owner, setter = _message_box_setter
+    if owner is not hwp:
+        setter = getattr(hwp, 'SetMessageBoxMode', None)
+        if setter is None:
+            setter = functools.partial(setattr, hwp, 'MessageBoxMode')
+        _message_box_setter = (hwp, setter)
+    setter(mode)
+
+def _get_action(hwp, name):
+    """액션 이름별 (Action, ParameterSet) 쌍을 한 번만 만들어 재사용합니다. 한글 객체가 바뀌면 캐시를 비웁니다."""
+    _check_handle_cache(hwp)
+
+    pair = _ACTION_CACHE.get(name)
+    if pair is None:
+        act = hwp.CreateAction(name)
+        pair = (act, act.CreateSet())
+        _ACTION_CACHE[name] = pair
+    return pair
+
+@functools.lru_cache(maxsize=256)
+def _i4(value):
+    """정수 항목 값을 VT_I4 VARIANT로 고정합니다. 자주 쓰는 값(여백, 크기 등)은 재사용합니다."""
+    return win32com.client.VARIANT(pythoncom.VT_I4, value)
+
+def _invoke_action(hwp, name, **items):
+    """
+    캐시된 액션의 파라미터셋에 items를 설정하고 실행합니다.
+    직전 호출과 값이 같은 항목은 다시 설정하지 않고, 이전 호출에서만 쓰인 항목은 지웁니다.
+    """
+    act, pset = _get_action(hwp, name)
+    last = _ACTION_ITEMS.get(name, {})
+
+    for key in last:
+        if key not in items:
+            pset.RemoveItem(key)
+
+    set_item = pset.SetItem
+    for key, value in items.items():
+        if key not in last or last[key] != value:
+            set_item(key, _i4(value) if type(value) is int else value)
+    _ACTION_ITEMS[name] = items
+
+    return act.Execute(pset)
+
+def _goto_page(hwp, page_number):
+    """page_number 페이지로 이동합니다. Goto 파라미터셋은 처음 한 번만 기본값으로 채우고 재사용합니다."""
+    _check_handle_cache(hwp)
+
+    cached = _PSET_CACHE.get("Goto")
+    if cached is None:
+        haction = hwp.HAction
+        hgoto = hwp.HParameterSet.HGotoE
+        hset = hgoto.HSet
+        haction.GetDefault("Goto", hset)
+        cached = (haction, hgoto, hset)
+        _PSET_CACHE["Goto"] = cached
+
+    haction, hgoto, hset = cached
+    hgoto.PageNumber = page_number
+    return haction.Execute("Goto", hset)
+
+def _read_page_text(hwp, page_number):
+    """page_number 페이지로 이동해 해당 페이지의 텍스트만 선택하여 읽어옵니다."""
+    _goto_page(hwp, page_number)
+
+    run = hwp.HAction.Run
+    run("MovePageBegin")
+    run("MoveSelPageDown")
+
+    text = hwp.GetTextFile("TEXT", "")
+    run("Cancel")
+    return text or ""
+
+def _select_pages(hwp, start_page, end_page, page_count):
+    """
+    start_page 처음부터 end_page 끝까지를 선택하고, 선택했으면 True를 반환합니다.
+    양 끝이 모두 본문(리스트 0)에 있으면 위치를 구해 SelectText 한 번으로 선택합니다.
+    SelectText의 문단 번호는 커서가 있는 리스트 기준이므로, 페이지 경계가 표 셀 등 하위 리스트에
+    걸리면 MoveSelPageDown을 페이지 수만큼 반복합니다.
+    그래도 선택 양 끝이 서로 다른 리스트에 있으면 선택을 취소하고 False를 반환합니다.
+    """
+    run = hwp.HAction.Run
+
+    # 시작 페이지 처음 위치
+    _goto_page(hwp, start_page)
+    run("MovePageBegin")
+    start_list, start_para, start_pos = hwp.GetPos()
+
+    # 끝 위치: 다음 페이지의 처음 (마지막 페이지까지면 문서 끝)
+    if end_page < page_count:
+        _goto_page(hwp, end_page + 1)
+        run("MovePageBegin")
+    else:
+        run("MoveDocEnd")
+    end_list, end_para, end_pos = hwp.GetPos()
+
+    if start_list == 0 and end_list == 0:
+        hwp.SelectText(start_para, start_pos, end_para, end_pos)
+        return True
+
+    # 하위 리스트에 걸린 경우: 시작 페이지부터 한 페이지씩 선택을 넓힘
+    _goto_page(hwp, start_page)
+    run("MovePageBegin")
+    for _ in range(end_page - start_page + 1):
+        run("MoveSelPageDown")
+
+    _, sel_start_list, _, _, sel_end_list, _, _ = hwp.GetSelectedPos()
+    if sel_start_list != sel_end_list:
+        run("Cancel")
+        return False
+    return True
+
+def _find_replace(hwp, action, find_string, replace_string=None):
+    """
+    HFindReplace 파라미터셋으로 찾기/바꾸기 계열 액션(AllReplace, Replace, RepeatFind)을 실행합니다.
+    핸들은 한 번만 가져오고, GetDefault는 직전과 다른 액션일 때만 다시 실행합니다.
+    검색/바꿀 문자열도 직전과 다를 때만 설정하므로 같은 검색을 반복하면 Execute만 호출됩니다.
+    """
+    _check_handle_cache(hwp)
+
+    cached = _PSET_CACHE.get("FindReplace")
+    if cached is None:
+        hfind = hwp.HParameterSet.HFindReplace
+        cached = [hwp.HAction, hfind, hfind.HSet, None, None, None]
+        _PSET_CACHE["FindReplace"] = cached
+
+    haction, hfind, hset, last_action, last_find, last_replace = cached
+    if action != last_action:
+        haction.GetDefault(action, hset)
+        if action == "AllReplace":
+            hfind.ReplaceMode = 1  # 모두 바꾸기
+        # GetDefault가 파라미터셋을 초기화하므로 문자열도 다시 설정해야 함
+        last_find = last_replace = None
+        cached[3:] = [action, None, None]
+
+    if find_string != last_find:
+        hfind.FindString = find_string
+        cached[4] = find_string
+    if replace_string is not None and replace_string != last_replace:
+        hfind.ReplaceString = replace_string
+        cached[5] = replace_string
+    return haction.Execute(action, hset)
+
+# 페이지 수 캐시: (한글 객체, 리비전, 조회 시각, 페이지 수)
+# 한글 창에서 직접 편집하는 경우를 위해 리비전이 같아도 _PAGE_COUNT_TTL초가 지나면 다시 조회
+_PAGE_COUNT_TTL = 1.0
+_page_count_cache = (None, -1, 0.0, 0)
+
+def _page_count(hwp):
+    """hwp.PageCount를 반환합니다. 문서를 바꾸는 도구가 실행되지 않았다면 짧게 캐시합니다."""
+    global _page_count_cache
+
+    owner, rev, cached_at, count = _page_count_cache
+    now = time.monotonic()
+    if owner is hwp and rev == _doc_rev and now - cached_at < _PAGE_COUNT_TTL:
+        return count
+
+    count = hwp.PageCount
+    _page_count_cache = (hwp, _doc_rev, now, count)
+    return count
+
+# 컨트롤 목록 캐시: (한글 객체, 리비전, 조회 시각, {CtrlID: [컨트롤, ...]})
+# HeadCtrl부터 Next로 따라가는 순회는 컨트롤마다 COM 호출이 필요하므로 한 번 훑어 종류별로 묶어 둠
+_CTRL_INDEX_TTL = 1.0
+_ctrl_index_cache = (None, -1, 0.0, None)
+
+def _control_index(hwp):
+    """문서의 컨트롤을 CtrlID별 목록(문서 순서)으로 반환합니다. _page_count와 같은 방식으로 캐시합니다."""
+    global _ctrl_index_cache
+
+    owner, rev, cached_at, index = _ctrl_index_cache
+    now = time.monotonic()
+    if owner is hwp and rev == _doc_rev and now - cached_at < _CTRL_INDEX_TTL:
+        return index
+
+    index = {}
+    ctrl = hwp.HeadCtrl
+    while ctrl:
+        try:
+            index.setdefault(ctrl.CtrlID, []).append(ctrl)
+            ctrl = ctrl.Next
+        except:
+            break
+
+    _ctrl_index_cache = (hwp, _doc_rev, now, index)
+    return index
+
+# 문서 구조 분석 캐시: (한글 객체, 리비전, 문서 경로, (텍스트 통계 포함, 제목 포함), 조회 시각, 분석 결과)
+# 전체 텍스트 전송과 컨트롤 순회가 비싸므로 문서를 바꾸는 도구가 실행되지 않았다면 재사용
+_STRUCTURE_CACHE_TTL = 2.0
+_structure_cache = (None, -1, "", (False, False), 0.0, None)
+
+def _document_stats(hwp, active_path, include_text_stats=True, include_headings=True):
+    """
+    get_document_structure에 쓰이는 (글자 수, 문단 수, 표 수, 이미지 수, 도형 수, 제목 목록)을 반환합니다.
+    요청하지 않은 항목은 None이며, 둘 다 빼면 문서 텍스트를 가져오지 않습니다.
+    _page_count와 같은 방식으로 리비전과 짧은 TTL로 캐시하고, 더 많은 항목을 담은 캐시도 재사용합니다.
+    """
+    global _structure_cache
+
+    owner, rev, path, (has_text_stats, has_headings), cached_at, stats = _structure_cache
+    now = time.monotonic()
+    if (owner is hwp and rev == _doc_rev and path == active_path
+            and now - cached_at < _STRUCTURE_CACHE_TTL
+            and (has_text_stats or not include_text_stats)
+            and (has_headings or not include_headings)):
+        char_count, paragraph_count, table_count, image_count, shape_count, headings = stats
+    else:
+        char_count = paragraph_count = headings = None
+
+        if include_text_stats or include_headings:
+            # 선택 영역/커서와 무관하게 문서 전체를 가져옴
+            full_text = hwp.GetTextFile("UNICODE", "saveblock:false")
+
+            if full_text is None:
+                full_text = ""
+
+            if include_text_stats:
+                char_count, paragraph_count = text_stats(full_text)
+
+            if include_headings:
+                headings = scan_headings(full_text)
+
+        controls = _control_index(hwp)
+        table_count = len(controls.get('tbl', ()))
+        image_count = len(controls.get('ole', ())) + len(controls.get('pic', ()))
+        shape_count = len(controls.get('gso', ()))
+
+        stats = (char_count, paragraph_count, table_count, image_count, shape_count, headings)
+        _structure_cache = (hwp, _doc_rev, active_path, (include_text_stats, include_headings), now, stats)
+
+    if not include_text_stats:
+        char_count = paragraph_count = None
+    if not include_headings:
+        headings = None
+    return char_count, paragraph_count, table_count, image_count, shape_count, headings
+
+_fast_mode_depth = 0
+
+@contextmanager
+def _fast_mode(hwp):
+    """
+    화면 업데이트를 끈 상태에서 작업을 실행합니다.
+    사용자가 이미 화면 업데이트를 끈 경우(대량 작업 모드)에는 그대로 둡니다.
+    """
+    global _fast_mode_depth
+
+    toggle = _fast_mode_depth == 0 and hwp_controller.screen_update_enabled
+    if toggle:
+        try:
+            hwp.SetScreenUpdate(0)
+        except:
+            toggle = False
+
+    _fast_mode_depth += 1
+    try:
+        yield
+    finally:
+        _fast_mode_depth -= 1
+        if toggle:
+            try:
+                hwp.SetScreenUpdate(1)
+            except:
+                pass
+
+def _goto_paragraph(hwp, paragraph_index):
+    """
+    본문의 paragraph_index번째 문단(0부터) 시작으로 커서를 바로 이동합니다.
+    MoveParaDown을 반복하지 않고 SetPos(본문 리스트, 문단, 0) 한 번으로 이동하며, 범위를 벗어나면 False를 반환합니다.
+    """
+    return bool(hwp.SetPos(0, paragraph_index, 0))
+
+def _snapshot_documents(hwp):
+    """열린 문서를 (문서 객체, 경로) 목록으로 한 번에 가져옵니다."""
+    docs = hwp.XHwpDocuments
+    snapshot = []
+    for i in range(docs.Count):
+        doc = docs.Item(i)
+        snapshot.append((doc, doc.Path or ""))
+    return snapshot
+
+# 창 목록은 도구 호출 간격에 비해 천천히 바뀌므로 짧게 캐시합니다
+_WINDOW_CACHE_TTL = 0.5
+_window_cache = (0.0, [])
+
+# 한글 창 판별 기준: 클래스명 접두어(HwpFrameClass 등) 또는 창 제목
+_HWP_CLASS_PREFIX = "Hwp"
+_HWP_TITLE_RE = re.compile(r'한글|\.hwp$')
+
+# 창 제목/클래스명은 pywin32 래퍼 대신 user32를 직접 호출해 스캔마다 한 번 만든 버퍼에 읽음
+_WINDOW_TEXT_BUF_LEN = 512
+_user32 = ctypes.windll.user32
+_user32.GetWindowTextW.argtypes = [ctypes.wintypes.HWND, ctypes.wintypes.LPWSTR, ctypes.c_int]
+_user32.GetWindowTextW.restype = ctypes.c_int
+_user32.GetClassNameW.argtypes = [ctypes.wintypes.HWND, ctypes.wintypes.LPWSTR, ctypes.c_int]
+_user32.GetClassNameW.restype = ctypes.c_int
+
+# 한글 메인 창 클래스명 (FindWindowEx로 한글 창만 바로 찾을 때 사용)
+_HWP_FRAME_CLASS = "HwpFrameClass"
+
+def _scan_hwp_frames(needle=None):
+    """
+    FindWindowEx로 한글 메인 창 클래스의 최상위 창만 열거합니다.
+    다른 프로그램의 창은 거치지 않으며, 해당 클래스의 창이 없으면 빈 목록을 반환합니다.
+    """
+    hwp_windows = []
+    buf = ctypes.create_unicode_buffer(_WINDOW_TEXT_BUF_LEN)
+    get_text = _user32.GetWindowTextW
+    hwnd = win32gui.FindWindowEx(0, 0, _HWP_FRAME_CLASS, None)
+    while hwnd:
+        if win32gui.IsWindowVisible(hwnd):
+            window_text = buf.value[:get_text(hwnd, buf, _WINDOW_TEXT_BUF_LEN)]
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            win = {
+                'hwnd': hwnd,
+                'title': window_text,
+                'class': _HWP_FRAME_CLASS,
+                'pid': pid
+            }
+            hwp_windows.append(win)
+            if needle is not None and needle in window_text.lower():
+                return hwp_windows, win
+        hwnd = win32gui.FindWindowEx(0, hwnd, _HWP_FRAME_CLASS, None)
+    return hwp_windows, None
+
+def _scan_hwp_windows(needle=None):
+    """
+    보이는 한글 창을 열거해 (창 목록, 찾은 창)을 반환합니다.
+    needle이 주어지면 제목에 needle이 포함된 첫 창에서 열거를 중단합니다.
+    한글 메인 창 클래스로 먼저 찾고, 없거나(버전에 따라 클래스명이 다름) 그 중에 찾는 창이
+    없으면 전체 창을 열거합니다.
+    """
+    hwp_windows, target = _scan_hwp_frames(needle)
+    if target is not None or (hwp_windows and needle is None):
+        return hwp_windows, target
+
+    found = []
+    text_buf = ctypes.create_unicode_buffer(_WINDOW_TEXT_BUF_LEN)
+    class_buf = ctypes.create_unicode_buffer(_WINDOW_TEXT_BUF_LEN)
+    get_text = _user32.GetWindowTextW
+    get_class = _user32.GetClassNameW
+
+    def enum_windows_callback(hwnd, results):
+        if win32gui.IsWindowVisible(hwnd):
+            class_name = class_buf.value[:get_class(hwnd, class_buf, _WINDOW_TEXT_BUF_LEN)]
+            window_text = text_buf.value[:get_text(hwnd, text_buf, _WINDOW_TEXT_BUF_LEN)]
+
+            if class_name.startswith(_HWP_CLASS_PREFIX) or _HWP_TITLE_RE.search(window_text):
+                _, pid = win32process.GetWindowThreadProcessId(hwnd)
+                win = {
+                    'hwnd': hwnd,
+                    'title': window_text,
+                    'class': class_name,
+                    'pid': pid
+                }
+                results.append(win)
+                if needle is not None and needle in window_text.lower():
+                    found.append(win)
+                    return False
+        return True
+
+    hwp_windows = []
+    try:
+        win32gui.EnumWindows(enum_windows_callback, hwp_windows)
+    except win32gui.error:
+        # 콜백이 False를 반환하면 pywin32 버전에 따라 오류로 보고됨
+        if not found:
+            raise
+    return hwp_windows, (found[0] if found else None)
+
+def _enum_hwp_windows():
+    """보이는 한글 창 목록을 조회합니다. (_WINDOW_CACHE_TTL초 동안 캐시)"""
+    global _window_cache
+
+    cached_at, cached = _window_cache
+    now = time.monotonic()
+    if now - cached_at < _WINDOW_CACHE_TTL:
+        return list(cached)
+
+    hwp_windows, _ = _scan_hwp_windows()
+    _window_cache = (now, hwp_windows)
+    return list(hwp_windows)
+
+def _invalidate_window_cache():
+    """창 상태가 바뀐 뒤(연결, 종료) 다음 조회에서 다시 열거하도록 캐시를 비웁니다."""
+    global _window_cache
+    _window_cache = (0.0, [])
+
+def _find_hwp_window(search_text):
+    """
+    제목에 search_text가 포함된 첫 한글 창을 찾아 (찾은 창, 창 목록)을 반환합니다.
+    찾은 경우 창 목록은 열거를 중단한 시점까지의 일부입니다.
+    """
+    global _window_cache
+
+    needle = search_text.lower()
+    cached_at, cached = _window_cache
+    now = time.monotonic()
+    if now - cached_at < _WINDOW_CACHE_TTL:
+        for win in cached:
+            if needle in win['title'].lower():
+                return win, list(cached)
+        return None, list(cached)
+
+    hwp_windows, target_window = _scan_hwp_windows(needle)
+    if target_window is None:
+        # 끝까지 열거한 경우에만 전체 목록으로 캐시
+        _window_cache = (now, hwp_windows)
+    return target_window, list(hwp_windows)
+
+# 한글 프로세스 수 조회 (tasklist 실행 대신 Toolhelp 스냅샷 사용)
+_HWP_EXE_NAME = "hwp.exe"
+_PROCESS_CACHE_TTL = 1.0
+_process_count_cache = (0.0, 0)
+_TH32CS_SNAPPROCESS = 0x00000002
+_INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+class _PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", ctypes.wintypes.DWORD),
+        ("cntUsage", ctypes.wintypes.DWORD),
+        ("th32ProcessID", ctypes.wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_void_p),
+        ("th32ModuleID", ctypes.wintypes.DWORD),
+        ("cntThreads", ctypes.wintypes.DWORD),
+        ("th32ParentProcessID", ctypes.wintypes.DWORD),
+        ("pcPriClassBase", ctypes.c_long),
+        ("dwFlags", ctypes.wintypes.DWORD),
+        ("szExeFile", ctypes.c_wchar * 260),
+    ]
+
+# Toolhelp 함수 프로토타입은 모듈 로드 시 한 번만 지정
+# (argtypes가 없으면 64비트에서 스냅샷 핸들이 int로 잘려 전달됨)
+_kernel32 = ctypes.windll.kernel32
+_kernel32.CreateToolhelp32Snapshot.argtypes = [ctypes.wintypes.DWORD, ctypes.wintypes.DWORD]
+_kernel32.CreateToolhelp32Snapshot.restype = ctypes.wintypes.HANDLE
+_kernel32.Process32FirstW.argtypes = [ctypes.wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+_kernel32.Process32FirstW.restype = ctypes.wintypes.BOOL
+_kernel32.Process32NextW.argtypes = [ctypes.wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+_kernel32.Process32NextW.restype = ctypes.wintypes.BOOL
+_kernel32.CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+_kernel32.CloseHandle.restype = ctypes.wintypes.BOOL
+
+def _count_hwp_processes():
+    """실행 중인 Hwp.exe 프로세스 수를 반환합니다. (_PROCESS_CACHE_TTL초 동안 캐시)"""
+    global _process_count_cache
+
+    cached_at, cached = _process_count_cache
+    now = time.monotonic()
+    if now - cached_at < _PROCESS_CACHE_TTL:
+        return cached
+
+    snapshot = _kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if snapshot is None or snapshot == _INVALID_HANDLE_VALUE:
+        raise ctypes.WinError()
+
+    count = 0
+    try:
+        entry = _PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(_PROCESSENTRY32W)
+        entry_ref = ctypes.byref(entry)
+        next_entry = _kernel32.Process32NextW
+        more = _kernel32.Process32FirstW(snapshot, entry_ref)
+        while more:
+            if entry.szExeFile.lower() == _HWP_EXE_NAME:
+                count += 1
+            more = next_entry(snapshot, entry_ref)
+    finally:
+        _kernel32.CloseHandle(snapshot)
+
+    _process_count_cache = (now, count)
+    return count
+
+# 창 활성화 후 한글이 입력을 받을 준비가 될 때까지 기다리는 최대 시간 (초)
+_ACTIVATE_TIMEOUT = 0.3
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_SYNCHRONIZE = 0x00100000
+_kernel32.OpenProcess.argtypes = [ctypes.wintypes.DWORD, ctypes.wintypes.BOOL, ctypes.wintypes.DWORD]
+_kernel32.OpenProcess.restype = ctypes.wintypes.HANDLE
+_user32.WaitForInputIdle.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD]
+_user32.WaitForInputIdle.restype = ctypes.wintypes.DWORD
+
+def _wait_for_activation(hwnd, pid):
+    """
+    hwnd가 전면 창이 되고 해당 프로세스가 입력 대기 상태가 될 때까지 기다립니다.
+    고정 대기 대신 조건이 맞는 즉시 반환하며, 최대 _ACTIVATE_TIMEOUT초까지 기다립니다.
+    """
+    deadline = time.monotonic() + _ACTIVATE_TIMEOUT
+    while win32gui.GetForegroundWindow() != hwnd:
+        if time.monotonic() >= deadline:
+            return
+        time.sleep(0.01)
+
+    remaining_ms = int(max(0.0, deadline - time.monotonic()) * 1000)
+    process = _kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION | _SYNCHRONIZE, False, pid)
+    if not process:
+        return
+    try:
+        _user32.WaitForInputIdle(process, remaining_ms)
+    finally:
+        _kernel32.CloseHandle(process)
+
+@_hwp_tool()
 def initialize_hwp() -> str:
     """한글 프로그램을 초기화합니다."""
     try:
@@ -139,152 +1014,83 @@ def initialize_hwp() -> str:
         else:
             return "한글 프로그램 초기화 실패"
     except Exception as e:
-        logger.error(f"초기화 중 오류: {e}")
+        logger.error("초기화 중 오류: %s", e)
         return f"초기화 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def get_running_hwp_documents() -> str:
     """실행 중인 한글에서 열린 문서 목록을 조회합니다."""
     try:
-        pythoncom.CoInitialize()
-        
-        hwp = None
-        
-        # 1. 이미 연결된 컨트롤러가 있으면 사용
-        if hwp_controller.is_initialized and hwp_controller.hwp:
-            hwp = hwp_controller.hwp
-        else:
-            # 2. GetActiveObject 시도
-            try:
-                hwp = win32com.client.GetActiveObject("HWPFrame.HwpObject")
-            except:
-                pass
-            
-            # 3. GetActiveObject 실패 시 Dispatch로 연결 시도
-            if hwp is None:
-                try:
-                    hwp = win32com.client.Dispatch("HWPFrame.HwpObject")
-                    if hwp.XHwpDocuments.Count == 0:
-                        return "실행 중인 한글 프로그램이 없습니다. initialize_hwp()로 시작하세요."
-                except:
-                    return "실행 중인 한글 프로그램이 없습니다. initialize_hwp()로 시작하세요."
+        hwp = hwp_controller.acquire()
+        if hwp is None:
+            return "실행 중인 한글 프로그램이 없습니다. initialize_hwp()로 시작하세요."
         
         # 열린 문서 목록 가져오기
-        doc_count = hwp.XHwpDocuments.Count
+        snapshot = _snapshot_documents(hwp)
+        doc_count = len(snapshot)
         if doc_count == 0:
             return "한글이 실행 중이지만 열린 문서가 없습니다."
         
-        documents = []
-        for i in range(doc_count):
-            doc = hwp.XHwpDocuments.Item(i)
-            doc_path = doc.Path if doc.Path else "(새 문서)"
-            doc_name = doc.Path.split("\\")[-1] if doc.Path else f"새 문서 {i+1}"
-            documents.append({
-                "index": i,
-                "name": doc_name,
-                "path": doc_path
-            })
-        
-        result = f"현재 연결된 한글에서 열린 문서 ({doc_count}개):\n"
-        for doc in documents:
-            result += f"  [{doc['index']}] {doc['name']}\n"
-            result += f"      경로: {doc['path']}\n"
+        lines = [f"현재 연결된 한글에서 열린 문서 ({doc_count}개):"]
+        for i, (_, path) in enumerate(snapshot):
+            doc_path = path if path else "(새 문서)"
+            doc_name = ntpath.basename(path) if path else f"새 문서 {i+1}"
+            lines.append(f"  [{i}] {doc_name}")
+            lines.append(f"      경로: {doc_path}")
+        result = "\n".join(lines) + "\n"
         
         # 여러 한글 프로세스 확인 안내
         try:
-            import subprocess
-            result_proc = subprocess.run(['tasklist', '/FI', 'IMAGENAME eq Hwp.exe', '/FO', 'CSV', '/NH'], 
-                                        capture_output=True, text=True)
-            hwp_count = len([line for line in result_proc.stdout.strip().split('\n') if 'Hwp.exe' in line])
+            hwp_count = _count_hwp_processes()
             if hwp_count > 1:
-                result += f"\n⚠️ 주의: 한글 프로그램이 {hwp_count}개 실행 중입니다.\n"
-                result += "   다른 인스턴스에 연결하려면 list_all_hwp_windows()를 호출하세요."
+                result += (f"\n⚠️ 주의: 한글 프로그램이 {hwp_count}개 실행 중입니다.\n"
+                           "   다른 인스턴스에 연결하려면 list_all_hwp_windows()를 호출하세요.")
         except:
             pass
         
-        logger.info(f"열린 문서 목록 조회 완료: {doc_count}개")
+        logger.info("열린 문서 목록 조회 완료: %s개", doc_count)
         return result
         
     except Exception as e:
-        logger.error(f"문서 목록 조회 실패: {e}")
+        logger.error("문서 목록 조회 실패: %s", e)
         return f"문서 목록 조회 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def list_all_hwp_windows() -> str:
     """실행 중인 모든 한글 창 목록을 조회합니다. (창 제목으로 파일명 확인)"""
     try:
-        hwp_windows = []
-        
-        def enum_windows_callback(hwnd, results):
-            if win32gui.IsWindowVisible(hwnd):
-                window_text = win32gui.GetWindowText(hwnd)
-                class_name = win32gui.GetClassName(hwnd)
-                
-                if 'Hwp' in class_name or '한글' in window_text or window_text.endswith('.hwp'):
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    results.append({
-                        'hwnd': hwnd,
-                        'title': window_text,
-                        'class': class_name,
-                        'pid': pid
-                    })
-            return True
-        
-        win32gui.EnumWindows(enum_windows_callback, hwp_windows)
+        hwp_windows = _enum_hwp_windows()
         
         if not hwp_windows:
             return "실행 중인 한글 창을 찾을 수 없습니다."
         
-        result = f"실행 중인 한글 창 ({len(hwp_windows)}개):\n"
+        lines = [f"실행 중인 한글 창 ({len(hwp_windows)}개):"]
         for i, win in enumerate(hwp_windows):
-            result += f"  [{i}] {win['title']}\n"
-            result += f"      PID: {win['pid']}, HWND: {win['hwnd']}\n"
-        
-        result += "\n특정 창에 연결하려면 connect_to_hwp_window(파일명 일부)를 호출하세요."
+            lines.append(f"  [{i}] {win['title']}")
+            lines.append(f"      PID: {win['pid']}, HWND: {win['hwnd']}")
+        lines.append("")
+        lines.append("특정 창에 연결하려면 connect_to_hwp_window(파일명 일부)를 호출하세요.")
+        result = "\n".join(lines)
         
-        logger.info(f"한글 창 목록 조회: {len(hwp_windows)}개")
+        logger.info("한글 창 목록 조회: %s개", len(hwp_windows))
         return result
         
     except Exception as e:
-        logger.error(f"한글 창 목록 조회 실패: {e}")
+        logger.error("한글 창 목록 조회 실패: %s", e)
         return f"한글 창 목록 조회 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def connect_to_hwp_window(search_text: str) -> str:
     """특정 파일명이 포함된 한글 창을 활성화하고 연결합니다."""
     try:
-        pythoncom.CoInitialize()
-        
-        hwp_windows = []
-        
-        def enum_windows_callback(hwnd, results):
-            if win32gui.IsWindowVisible(hwnd):
-                window_text = win32gui.GetWindowText(hwnd)
-                class_name = win32gui.GetClassName(hwnd)
-                
-                if 'Hwp' in class_name or '한글' in window_text or window_text.endswith('.hwp'):
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    results.append({
-                        'hwnd': hwnd,
-                        'title': window_text,
-                        'class': class_name,
-                        'pid': pid
-                    })
-            return True
-        
-        win32gui.EnumWindows(enum_windows_callback, hwp_windows)
-        
-        if not hwp_windows:
-            return "실행 중인 한글 창을 찾을 수 없습니다."
+        _ensure_com()
         
-        # 검색어가 포함된 창 찾기
-        target_window = None
-        for win in hwp_windows:
-            if search_text.lower() in win['title'].lower():
-                target_window = win
-                break
+        # 검색어가 포함된 창 찾기 (찾으면 열거 중단)
+        target_window, hwp_windows = _find_hwp_window(search_text)
         
         if target_window is None:
+            if not hwp_windows:
+                return "실행 중인 한글 창을 찾을 수 없습니다."
             titles = [w['title'] for w in hwp_windows]
             return f"'{search_text}'이(가) 포함된 창을 찾을 수 없습니다.\n실행 중인 창: {titles}"
         
@@ -303,157 +1109,111 @@ def connect_to_hwp_window(search_text: str) -> str:
             except:
                 pass
         
-        import time
-        time.sleep(0.3)
+        _wait_for_activation(hwnd, target_window['pid'])
         
         try:
-            hwp_controller.hwp = win32com.client.GetActiveObject("HWPFrame.HwpObject")
+            hwp = _early_bind(win32com.client.GetActiveObject(HWP_PROGID))
         except:
-            hwp_controller.hwp = win32com.client.Dispatch("HWPFrame.HwpObject")
+            hwp = _early_bind(win32com.client.Dispatch(HWP_PROGID))
         
+        hwp_controller.hwp = hwp
         hwp_controller.is_initialized = True
         
-        doc_count = hwp_controller.hwp.XHwpDocuments.Count
+        docs = hwp.XHwpDocuments
+        doc_count = docs.Count
         if doc_count > 0:
-            current_doc = hwp_controller.hwp.XHwpDocuments.Item(0)
-            hwp_controller.current_document = current_doc.Path if current_doc.Path else "새 문서"
+            hwp_controller.current_document = docs.Item(0).Path or "새 문서"
+        
+        # 창을 복원/활성화했으므로 이전 목록은 더 이상 유효하지 않음
+        _invalidate_window_cache()
         
-        logger.info(f"한글 창 연결 완료: {target_window['title']}")
+        logger.info("한글 창 연결 완료: %s", target_window['title'])
         return f"'{target_window['title']}' 창에 연결되었습니다. (열린 문서: {doc_count}개)"
         
     except Exception as e:
-        logger.error(f"한글 창 연결 실패: {e}")
+        logger.error("한글 창 연결 실패: %s", e)
         return f"한글 창 연결 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def connect_to_running_hwp() -> str:
     """이미 실행 중인 한글 프로그램에 연결합니다."""
     try:
-        pythoncom.CoInitialize()
-        
-        hwp = None
-        
-        try:
-            hwp = win32com.client.GetActiveObject("HWPFrame.HwpObject")
-        except:
-            pass
+        hwp = hwp_controller.acquire(launch=True)
         
         if hwp is None:
-            try:
-                hwp = win32com.client.Dispatch("HWPFrame.HwpObject")
-                if hwp.XHwpDocuments.Count == 0:
-                    hwp_controller.hwp = hwp
-                    hwp_controller.is_initialized = True
-                    return "실행 중인 한글이 없어 새로 시작했습니다. (열린 문서: 0개)"
-            except Exception as e:
-                return f"한글 연결 실패: {e}"
-        
-        hwp_controller.hwp = hwp
-        hwp_controller.is_initialized = True
+            return "한글 연결 실패: 한글 프로그램을 시작할 수 없습니다."
+        if hwp_controller.launched:
+            return "실행 중인 한글이 없어 새로 시작했습니다. (열린 문서: 0개)"
         
-        doc_count = hwp_controller.hwp.XHwpDocuments.Count
+        docs = hwp.XHwpDocuments
+        doc_count = docs.Count
         if doc_count > 0:
-            current_doc = hwp_controller.hwp.XHwpDocuments.Item(0)
-            hwp_controller.current_document = current_doc.Path if current_doc.Path else "새 문서"
+            hwp_controller.current_document = docs.Item(0).Path or "새 문서"
         
         logger.info("실행 중인 한글에 연결 완료")
         return f"실행 중인 한글에 연결되었습니다. (열린 문서: {doc_count}개)"
         
     except Exception as e:
-        logger.error(f"한글 연결 실패: {e}")
+        logger.error("한글 연결 실패: %s", e)
         return f"한글 연결 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def switch_to_document(file_name: str) -> str:
     """열린 문서 중 특정 파일로 전환합니다. 파일명 일부만 입력해도 됩니다."""
     try:
-        pythoncom.CoInitialize()
-        
-        hwp = None
+        hwp = hwp_controller.acquire()
+        if hwp is None:
+            return "실행 중인 한글 프로그램이 없습니다."
         
-        if hwp_controller.is_initialized and hwp_controller.hwp:
-            hwp = hwp_controller.hwp
-        else:
-            try:
-                hwp = win32com.client.GetActiveObject("HWPFrame.HwpObject")
-            except:
-                pass
-            
-            if hwp is None:
-                try:
-                    hwp = win32com.client.Dispatch("HWPFrame.HwpObject")
-                    if hwp.XHwpDocuments.Count == 0:
-                        return "실행 중인 한글 프로그램이 없습니다."
-                except:
-                    return "실행 중인 한글 프로그램이 없습니다."
-        
-        doc_count = hwp.XHwpDocuments.Count
-        if doc_count == 0:
+        snapshot = _snapshot_documents(hwp)
+        if not snapshot:
             return "열린 문서가 없습니다."
         
+        needle = file_name.lower()
         found_doc = None
-        found_index = -1
+        found_path = ""
         
-        for i in range(doc_count):
-            doc = hwp.XHwpDocuments.Item(i)
-            doc_path = doc.Path if doc.Path else ""
-            doc_name = doc_path.split("\\")[-1] if doc_path else f"새 문서 {i+1}"
+        for i, (doc, doc_path) in enumerate(snapshot):
+            doc_name = ntpath.basename(doc_path) if doc_path else f"새 문서 {i+1}"
             
-            if file_name.lower() in doc_name.lower() or file_name.lower() in doc_path.lower():
+            if needle in doc_name.lower() or needle in doc_path.lower():
                 found_doc = doc
-                found_index = i
+                found_path = doc_path
                 break
         
         if found_doc is None:
             return f"'{file_name}'이(가) 포함된 문서를 찾을 수 없습니다."
         
-        hwp.XHwpDocuments.Item(found_index).SetActive()
+        found_doc.SetActive()
         
-        hwp_controller.hwp = hwp
-        hwp_controller.is_initialized = True
-        hwp_controller.current_document = found_doc.Path
+        hwp_controller.current_document = found_path
         
-        doc_name = found_doc.Path.split("\\")[-1] if found_doc.Path else f"새 문서"
-        logger.info(f"문서 전환 완료: {doc_name}")
+        doc_name = ntpath.basename(found_path) if found_path else "새 문서"
+        logger.info("문서 전환 완료: %s", doc_name)
         return f"'{doc_name}' 문서로 전환했습니다."
         
     except Exception as e:
-        logger.error(f"문서 전환 실패: {e}")
+        logger.error("문서 전환 실패: %s", e)
         return f"문서 전환 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def get_active_document_info() -> str:
     """현재 활성화된 문서의 정보를 조회합니다."""
     try:
-        pythoncom.CoInitialize()
-        
-        hwp = None
+        hwp = hwp_controller.acquire()
+        if hwp is None:
+            return "실행 중인 한글 프로그램이 없습니다."
         
-        if hwp_controller.is_initialized and hwp_controller.hwp:
-            hwp = hwp_controller.hwp
-        else:
-            try:
-                hwp = win32com.client.GetActiveObject("HWPFrame.HwpObject")
-            except:
-                pass
-            
-            if hwp is None:
-                try:
-                    hwp = win32com.client.Dispatch("HWPFrame.HwpObject")
-                    if hwp.XHwpDocuments.Count == 0:
-                        return "실행 중인 한글 프로그램이 없습니다."
-                except:
-                    return "실행 중인 한글 프로그램이 없습니다."
-        
-        doc_count = hwp.XHwpDocuments.Count
+        docs = hwp.XHwpDocuments
+        doc_count = docs.Count
         if doc_count == 0:
             return "열린 문서가 없습니다."
         
-        active_doc = hwp.XHwpDocuments.Item(0)
-        doc_path = active_doc.Path if active_doc.Path else "(새 문서 - 저장되지 않음)"
-        doc_name = doc_path.split("\\")[-1] if active_doc.Path else "새 문서"
+        active_path = docs.Item(0).Path
+        doc_path = active_path if active_path else "(새 문서 - 저장되지 않음)"
+        doc_name = ntpath.basename(active_path) if active_path else "새 문서"
         
-        page_count = hwp.PageCount
+        page_count = _page_count(hwp)
         
         result = f"""현재 활성 문서 정보:
 - 파일명: {doc_name}
@@ -461,208 +1221,187 @@ def get_active_document_info() -> str:
 - 페이지 수: {page_count}
 - 총 열린 문서 수: {doc_count}개"""
         
-        logger.info(f"활성 문서 정보 조회: {doc_name}")
+        logger.info("활성 문서 정보 조회: %s", doc_name)
         return result
         
     except Exception as e:
-        logger.error(f"문서 정보 조회 실패: {e}")
+        logger.error("문서 정보 조회 실패: %s", e)
         return f"문서 정보 조회 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def create_document() -> str:
     """새 한글 문서를 생성합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        hwp_controller.hwp.HAction.Run("FileNew")
+        hwp.HAction.Run("FileNew")
         hwp_controller.current_document = "new_document"
         
         logger.info("새 문서 생성 완료")
         return "새 문서가 생성되었습니다."
         
     except Exception as e:
-        logger.error(f"문서 생성 실패: {e}")
+        logger.error("문서 생성 실패: %s", e)
         return f"문서 생성 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def open_document(file_path: str) -> str:
     """지정된 경로의 한글 문서를 엽니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
         if not os.path.exists(file_path):
             return f"파일을 찾을 수 없습니다: {file_path}"
         
-        try:
-            hwp_controller.hwp.RegisterModule("FilePathCheckDLL", "FilePathCheckerModule")
-        except:
-            pass
+        # initialize()를 거치지 않고 연결된 객체일 수 있으므로 등록 여부만 확인
+        _register_file_path_check(hwp)
         
         # 모든 대화상자 자동 처리: 버전 경고, 암호, 접근 권한 등
-        result = hwp_controller.hwp.Open(file_path, "HWP", "forceopen:true;versionwarning:false;suspendpassword:true")
+        if not hwp.Open(file_path, "HWP", "forceopen:true;versionwarning:false;suspendpassword:true"):
+            return f"문서 열기 실패: {file_path}"
 
-        if result:
-            hwp_controller.current_document = file_path
+        hwp_controller.current_document = file_path
 
-            # 한글 창을 화면 제일 앞으로 가져오기
-            try:
-                hwnd = hwp_controller.hwp.XHwpWindows.Active_XHwpWindow.WindowHandle
-                win32gui.SetForegroundWindow(hwnd)
-                win32gui.ShowWindow(hwnd, 9)  # SW_RESTORE
-            except:
-                pass
+        # 한글 창을 화면 제일 앞으로 가져오기
+        try:
+            hwnd = hwp.XHwpWindows.Active_XHwpWindow.WindowHandle
+            win32gui.SetForegroundWindow(hwnd)
+            win32gui.ShowWindow(hwnd, 9)  # SW_RESTORE
+        except:
+            pass
 
-            logger.info(f"문서 열기 완료: {file_path}")
-            return f"문서를 열었습니다: {file_path}"
-        else:
-            hwp_controller.hwp.HAction.GetDefault("FileOpen", hwp_controller.hwp.HParameterSet.HFileOpenSave.HSet)
-            hwp_controller.hwp.HParameterSet.HFileOpenSave.filename = file_path
-            hwp_controller.hwp.HParameterSet.HFileOpenSave.Format = "HWP"
-            hwp_controller.hwp.HAction.Execute("FileOpen", hwp_controller.hwp.HParameterSet.HFileOpenSave.HSet)
-            
-            hwp_controller.current_document = file_path
-            logger.info(f"문서 열기 완료 (대체방법): {file_path}")
-            return f"문서를 열었습니다: {file_path}"
+        logger.info("문서 열기 완료: %s", file_path)
+        return f"문서를 열었습니다: {file_path}"
         
     except Exception as e:
-        logger.error(f"문서 열기 실패: {e}")
+        logger.error("문서 열기 실패: %s", e)
         return f"문서 열기 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def save_document(file_path: Optional[str] = None) -> str:
     """현재 문서를 저장합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
         if file_path:
-            act = hwp_controller.hwp.CreateAction("FileSaveAs")
-            pset = act.CreateSet()
-            pset.SetItem("filename", file_path)
-            pset.SetItem("format", "HWP")
-            act.Execute(pset)
+            _invoke_action(hwp, "FileSaveAs", filename=file_path, format="HWP")
             
             hwp_controller.current_document = file_path
-            logger.info(f"문서 저장 완료: {file_path}")
+            logger.info("문서 저장 완료: %s", file_path)
             return f"문서를 저장했습니다: {file_path}"
         else:
-            hwp_controller.hwp.HAction.Run("FileSave")
+            hwp.HAction.Run("FileSave")
             logger.info("문서 저장 완료")
             return "문서를 저장했습니다."
             
     except Exception as e:
-        logger.error(f"문서 저장 실패: {e}")
+        logger.error("문서 저장 실패: %s", e)
         return f"문서 저장 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def close_document(save_changes: bool = False) -> str:
     """현재 문서를 닫습니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
         if save_changes:
-            hwp_controller.hwp.HAction.Run("FileSave")
+            hwp.HAction.Run("FileSave")
         
-        hwp_controller.hwp.HAction.Run("FileClose")
+        hwp.HAction.Run("FileClose")
         hwp_controller.current_document = None
         
         logger.info("문서 닫기 완료")
         return "문서를 닫았습니다."
         
     except Exception as e:
-        logger.error(f"문서 닫기 실패: {e}")
+        logger.error("문서 닫기 실패: %s", e)
         return f"문서 닫기 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def close_all_documents(save_changes: bool = False) -> str:
     """모든 문서를 닫습니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        closed_count = 0
-        max_attempts = 100
+        docs = hwp.XHwpDocuments
+        doc_count = docs.Count
+        # 문서 객체를 한 번만 가져와 저장/닫기에 재사용
+        documents = [docs.Item(i) for i in range(doc_count)]
         
-        for _ in range(max_attempts):
-            try:
-                if hwp_controller.hwp.XHwpDocuments.Count == 0:
-                    break
-                
-                if save_changes:
-                    hwp_controller.hwp.HAction.Run("FileSave")
-                
-                hwp_controller.hwp.XHwpDocuments.Item(0).SetModified(False)
-                hwp_controller.hwp.HAction.Run("FileClose")
-                closed_count += 1
-            except Exception as e:
-                logger.warning(f"문서 닫기 중 오류: {e}")
-                break
+        if save_changes:
+            for doc in documents:
+                doc.Save(True)
+        
+        try:
+            docs.Close(False)
+        except Exception as e:
+            # 컬렉션 단위 Close를 지원하지 않는 버전은 문서별로 닫음 (뒤에서부터)
+            logger.warning("일괄 닫기 실패, 문서별로 닫습니다: %s", e)
+            for doc in reversed(documents):
+                doc.Close(False)
+        
+        closed_count = doc_count - docs.Count
         
         hwp_controller.current_document = None
         
-        logger.info(f"모든 문서 닫기 완료: {closed_count}개")
+        logger.info("모든 문서 닫기 완료: %s개", closed_count)
         return f"모든 문서를 닫았습니다. ({closed_count}개)"
         
     except Exception as e:
-        logger.error(f"모든 문서 닫기 실패: {e}")
+        logger.error("모든 문서 닫기 실패: %s", e)
         return f"모든 문서 닫기 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def quit_hwp() -> str:
     """한글 프로그램을 종료합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        hwp_controller.hwp.Quit()
-        hwp_controller.hwp = None
-        hwp_controller.is_initialized = False
-        hwp_controller.current_document = None
+        hwp.Quit()
+        hwp_controller.reset()
+        _invalidate_window_cache()
         
         logger.info("한글 프로그램 종료 완료")
         return "한글 프로그램을 종료했습니다."
         
     except Exception as e:
-        logger.error(f"한글 종료 실패: {e}")
+        logger.error("한글 종료 실패: %s", e)
         return f"한글 종료 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def insert_text(text: str, position: str = "current") -> str:
     """텍스트를 삽입합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
         if position == "current":
-            act = hwp_controller.hwp.CreateAction("InsertText")
-            pset = act.CreateSet()
-            pset.SetItem("Text", text)
-            act.Execute(pset)
+            _invoke_action(hwp, "InsertText", Text=text)
         
-        logger.info(f"텍스트 삽입 완료: {text[:50]}...")
+        logger.info("텍스트 삽입 완료: %s...", text[:50])
         return f"텍스트를 삽입했습니다: {text[:50]}..."
         
     except Exception as e:
-        logger.error(f"텍스트 삽입 실패: {e}")
+        logger.error("텍스트 삽입 실패: %s", e)
         return f"텍스트 삽입 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def insert_text_at_position(text: str, x: int = 0, y: int = 0) -> str:
     """지정된 좌표에 텍스트를 삽입합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        hwp_controller.hwp.SetPosBySet(x, y)
+        hwp.SetPosBySet(x, y)
         
-        act = hwp_controller.hwp.CreateAction("InsertText")
-        pset = act.CreateSet()
-        pset.SetItem("Text", text)
-        act.Execute(pset)
+        _invoke_action(hwp, "InsertText", Text=text)
         
-        logger.info(f"위치 ({x}, {y})에 텍스트 삽입 완료")
+        logger.info("위치 (%s, %s)에 텍스트 삽입 완료", x, y)
         return f"위치 ({x}, {y})에 텍스트 '{text}'를 삽입했습니다."
         
     except Exception as e:
-        logger.error(f"위치별 텍스트 삽입 실패: {e}")
+        logger.error("위치별 텍스트 삽입 실패: %s", e)
         return f"위치별 텍스트 삽입 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def apply_font_format(font_name: str = "맑은 고딕", 
                      font_size: int = 11, 
                      bold: bool = False, 
@@ -671,153 +1410,119 @@ def apply_font_format(font_name: str = "맑은 고딕",
                      color: str = "black") -> str:
     """선택된 텍스트에 글꼴 서식을 적용합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        color_map = {
-            "black": 0x000000,
-            "red": 0xFF0000,
-            "blue": 0x0000FF,
-            "green": 0x00FF00,
-            "yellow": 0xFFFF00,
-            "purple": 0xFF00FF,
-            "cyan": 0x00FFFF
-        }
+        _invoke_action(hwp, "CharShape", **_char_shape_items(font_name, font_size, bold, italic, underline, color))
         
-        color_value = color_map.get(color.lower(), 0x000000)
-        
-        act = hwp_controller.hwp.CreateAction("CharShape")
-        pset = act.CreateSet()
-        pset.SetItem("FaceNameHangul", font_name)
-        pset.SetItem("FaceNameLatin", font_name)
-        pset.SetItem("FaceNameHanja", font_name)
-        pset.SetItem("FaceNameJapanese", font_name)
-        pset.SetItem("FaceNameOther", font_name)
-        pset.SetItem("FaceNameSymbol", font_name)
-        pset.SetItem("FaceNameUser", font_name)
-        pset.SetItem("Height", font_size * 100)
-        pset.SetItem("Bold", bold)
-        pset.SetItem("Italic", italic)
-        pset.SetItem("Underline", underline)
-        pset.SetItem("TextColor", color_value)
-        act.Execute(pset)
-        
-        logger.info(f"글꼴 서식 적용 완료: {font_name}, {font_size}pt")
+        logger.info("글꼴 서식 적용 완료: %s, %spt", font_name, font_size)
         return f"글꼴 서식을 적용했습니다: {font_name}, {font_size}pt"
         
     except Exception as e:
-        logger.error(f"글꼴 서식 적용 실패: {e}")
+        logger.error("글꼴 서식 적용 실패: %s", e)
         return f"글꼴 서식 적용 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def select_text_range(start_pos: int, end_pos: int) -> str:
     """지정된 범위의 텍스트를 선택합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        hwp_controller.hwp.SetPos(start_pos)
-        hwp_controller.hwp.MovePos(2, end_pos - start_pos, 1)
+        hwp.SetPos(start_pos)
+        hwp.MovePos(2, end_pos - start_pos, 1)
         
-        logger.info(f"텍스트 선택 완료: {start_pos} ~ {end_pos}")
+        logger.info("텍스트 선택 완료: %s ~ %s", start_pos, end_pos)
         return f"텍스트를 선택했습니다: 위치 {start_pos} ~ {end_pos}"
         
     except Exception as e:
-        logger.error(f"텍스트 선택 실패: {e}")
+        logger.error("텍스트 선택 실패: %s", e)
         return f"텍스트 선택 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def find_and_replace(find_text: str, replace_text: str, replace_all: bool = False) -> str:
     """텍스트를 찾아서 바꿉니다."""
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         # 문서 시작으로 이동
         hwp.HAction.Run("MoveDocBegin")
 
         # HParameterSet 방식 사용
         if replace_all:
-            hwp.HAction.GetDefault("AllReplace", hwp.HParameterSet.HFindReplace.HSet)
-            hwp.HParameterSet.HFindReplace.FindString = find_text
-            hwp.HParameterSet.HFindReplace.ReplaceString = replace_text
-            hwp.HParameterSet.HFindReplace.ReplaceMode = 1  # 모두 바꾸기
-            result = hwp.HAction.Execute("AllReplace", hwp.HParameterSet.HFindReplace.HSet)
+            result = _find_replace(hwp, "AllReplace", find_text, replace_text)
         else:
-            hwp.HAction.GetDefault("Replace", hwp.HParameterSet.HFindReplace.HSet)
-            hwp.HParameterSet.HFindReplace.FindString = find_text
-            hwp.HParameterSet.HFindReplace.ReplaceString = replace_text
-            result = hwp.HAction.Execute("Replace", hwp.HParameterSet.HFindReplace.HSet)
+            result = _find_replace(hwp, "Replace", find_text, replace_text)
 
         if result:
-            logger.info(f"찾기/바꾸기 완료: '{find_text}' -> '{replace_text}'")
+            logger.info("찾기/바꾸기 완료: '%s' -> '%s'", find_text, replace_text)
             return f"'{find_text}'를 '{replace_text}'로 {'모두 ' if replace_all else ''}바꾸었습니다."
         else:
             return f"'{find_text}'를 찾을 수 없습니다."
 
     except Exception as e:
-        logger.error(f"찾기/바꾸기 실패: {e}")
+        logger.error("찾기/바꾸기 실패: %s", e)
         return f"찾기/바꾸기 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def create_table(rows: int, cols: int, border: bool = True) -> str:
     """표를 생성합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        act = hwp_controller.hwp.CreateAction("TableCreate")
-        pset = act.CreateSet()
-        pset.SetItem("Rows", rows)
-        pset.SetItem("Cols", cols)
-        pset.SetItem("WidthType", 2)
-        pset.SetItem("HeightType", 0)
-        pset.SetItem("CreateItemArray", [0, 1, 0])
-        act.Execute(pset)
+        _invoke_action(
+            hwp, "TableCreate",
+            Rows=rows,
+            Cols=cols,
+            WidthType=2,
+            HeightType=0,
+            CreateItemArray=[0, 1, 0],
+        )
         
-        logger.info(f"표 생성 완료: {rows}행 {cols}열")
+        logger.info("표 생성 완료: %s행 %s열", rows, cols)
         return f"{rows}행 {cols}열 표를 생성했습니다."
         
     except Exception as e:
-        logger.error(f"표 생성 실패: {e}")
+        logger.error("표 생성 실패: %s", e)
         return f"표 생성 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def set_page_margins(top: int = 20, bottom: int = 20, left: int = 20, right: int = 20) -> str:
     """페이지 여백을 설정합니다. (단위: mm)"""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        act = hwp_controller.hwp.CreateAction("PageSetup")
-        pset = act.CreateSet()
-        pset.SetItem("TopMargin", top * 100)
-        pset.SetItem("BottomMargin", bottom * 100)
-        pset.SetItem("LeftMargin", left * 100)
-        pset.SetItem("RightMargin", right * 100)
-        act.Execute(pset)
+        _invoke_action(
+            hwp, "PageSetup",
+            TopMargin=top * 100,
+            BottomMargin=bottom * 100,
+            LeftMargin=left * 100,
+            RightMargin=right * 100,
+        )
         
-        logger.info(f"페이지 여백 설정 완료: 상{top} 하{bottom} 좌{left} 우{right}mm")
+        logger.info("페이지 여백 설정 완료: 상%s 하%s 좌%s 우%smm", top, bottom, left, right)
         return f"페이지 여백을 설정했습니다: 상{top} 하{bottom} 좌{left} 우{right}mm"
         
     except Exception as e:
-        logger.error(f"페이지 여백 설정 실패: {e}")
+        logger.error("페이지 여백 설정 실패: %s", e)
         return f"페이지 여백 설정 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def get_document_info() -> str:
     """현재 문서의 정보를 조회합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
         try:
-            page_count = hwp_controller.hwp.PageCount
+            page_count = _page_count(hwp)
         except:
             page_count = "Unknown"
             
         try:
-            current_pos = hwp_controller.hwp.GetPos()
+            current_pos = hwp.GetPos()
         except:
             current_pos = "Unknown"
             
         try:
-            list_count = getattr(hwp_controller.hwp, 'ListCount', 0)
+            list_count = _com_get(hwp, 'ListCount', 0)
         except:
             list_count = "Unknown"
         
@@ -838,362 +1543,393 @@ def get_document_info() -> str:
         return result
         
     except Exception as e:
-        logger.error(f"문서 정보 조회 실패: {e}")
+        logger.error("문서 정보 조회 실패: %s", e)
         return f"문서 정보 조회 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def set_paragraph_format(align: str = "left", 
                         left_indent: int = 0, 
                         right_indent: int = 0, 
                         line_spacing: float = 1.0) -> str:
     """문단 서식을 설정합니다."""
     try:
-        hwp_controller.check_initialization()
-        
-        align_map = {
-            "left": 0,
-            "center": 1,
-            "right": 2,
-            "justify": 3,
-            "distribute": 4
-        }
+        hwp = _require_hwp()
         
-        align_value = align_map.get(align.lower(), 0)
+        align_value = _lookup_folded(_ALIGN_MAP, align, 0)
         
-        act = hwp_controller.hwp.CreateAction("ParagraphShape")
-        pset = act.CreateSet()
-        pset.SetItem("Align", align_value)
-        pset.SetItem("IndentLeft", left_indent * 100)
-        pset.SetItem("IndentRight", right_indent * 100)
-        pset.SetItem("LineSpacing", int(line_spacing * 100))
-        act.Execute(pset)
+        _invoke_action(
+            hwp, "ParagraphShape",
+            Align=align_value,
+            IndentLeft=left_indent * 100,
+            IndentRight=right_indent * 100,
+            LineSpacing=int(line_spacing * 100),
+        )
         
-        logger.info(f"문단 서식 설정 완료: {align} 정렬, 줄간격 {line_spacing}")
+        logger.info("문단 서식 설정 완료: %s 정렬, 줄간격 %s", align, line_spacing)
         return f"문단 서식을 설정했습니다: {align} 정렬, 줄간격 {line_spacing}"
         
     except Exception as e:
-        logger.error(f"문단 서식 설정 실패: {e}")
+        logger.error("문단 서식 설정 실패: %s", e)
         return f"문단 서식 설정 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def set_page_size(width: int = 210, height: int = 297, orientation: str = "portrait") -> str:
     """용지 크기와 방향을 설정합니다. (단위: mm)"""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        if orientation.lower() == "landscape":
+        landscape = orientation.casefold() == "landscape"
+        if landscape:
             width, height = height, width
         
-        act = hwp_controller.hwp.CreateAction("PageSetup")
-        pset = act.CreateSet()
-        pset.SetItem("Width", width * 100)
-        pset.SetItem("Height", height * 100)
-        pset.SetItem("Orientation", 1 if orientation.lower() == "landscape" else 0)
-        act.Execute(pset)
+        _invoke_action(
+            hwp, "PageSetup",
+            Width=width * 100,
+            Height=height * 100,
+            Orientation=1 if landscape else 0,
+        )
         
-        logger.info(f"용지 설정 완료: {width}x{height}mm, {orientation}")
+        logger.info("용지 설정 완료: %sx%smm, %s", width, height, orientation)
         return f"용지를 설정했습니다: {width}x{height}mm, {orientation}"
         
     except Exception as e:
-        logger.error(f"용지 설정 실패: {e}")
+        logger.error("용지 설정 실패: %s", e)
         return f"용지 설정 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def insert_image(image_path: str, x: int = 0, y: int = 0, width: int = 100, height: int = 100) -> str:
     """이미지를 삽입합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
         if not os.path.exists(image_path):
             return f"이미지 파일을 찾을 수 없습니다: {image_path}"
         
-        act = hwp_controller.hwp.CreateAction("InsertPicture")
-        pset = act.CreateSet()
-        pset.SetItem("Path", image_path)
-        pset.SetItem("Embedded", True)
-        pset.SetItem("sizeoption", 3)
-        pset.SetItem("Width", width * 100)
-        pset.SetItem("Height", height * 100)
-        act.Execute(pset)
+        _invoke_action(
+            hwp, "InsertPicture",
+            Path=image_path,
+            Embedded=True,
+            sizeoption=3,
+            Width=width * 100,
+            Height=height * 100,
+        )
         
-        logger.info(f"이미지 삽입 완료: {image_path}")
+        logger.info("이미지 삽입 완료: %s", image_path)
         return f"이미지를 삽입했습니다: {image_path}"
         
     except Exception as e:
-        logger.error(f"이미지 삽입 실패: {e}")
+        logger.error("이미지 삽입 실패: %s", e)
         return f"이미지 삽입 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def insert_shape(shape_type: str, x: int = 0, y: int = 0, width: int = 50, height: int = 50) -> str:
     """도형을 삽입합니다."""
     try:
-        hwp_controller.check_initialization()
-        
-        shape_map = {
-            "rectangle": 1,
-            "ellipse": 2,
-            "line": 3,
-            "arrow": 4,
-            "textbox": 5
-        }
+        hwp = _require_hwp()
         
-        shape_value = shape_map.get(shape_type.lower(), 1)
+        shape_value = _lookup_folded(_SHAPE_MAP, shape_type, 1)
         
-        act = hwp_controller.hwp.CreateAction("DrawObjDialog")
-        pset = act.CreateSet()
-        pset.SetItem("ShapeType", shape_value)
-        pset.SetItem("TreatAsChar", False)
-        act.Execute(pset)
+        _invoke_action(hwp, "DrawObjDialog", ShapeType=shape_value, TreatAsChar=False)
         
-        logger.info(f"도형 삽입 완료: {shape_type}")
+        logger.info("도형 삽입 완료: %s", shape_type)
         return f"도형을 삽입했습니다: {shape_type}"
         
     except Exception as e:
-        logger.error(f"도형 삽입 실패: {e}")
+        logger.error("도형 삽입 실패: %s", e)
         return f"도형 삽입 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def insert_header_footer(text: str, is_header: bool = True, position: str = "center") -> str:
     """머리글 또는 바닥글을 삽입합니다."""
     try:
-        hwp_controller.check_initialization()
-        
-        if is_header:
-            hwp_controller.hwp.HAction.Run("HeaderFooterEdit")
-        else:
-            hwp_controller.hwp.HAction.Run("HeaderFooterEdit")
-        
-        act = hwp_controller.hwp.CreateAction("InsertText")
-        pset = act.CreateSet()
-        pset.SetItem("Text", text)
-        act.Execute(pset)
+        hwp = _require_hwp()
         
-        hwp_controller.hwp.HAction.Run("CloseEx")
+        with _fast_mode(hwp):
+            # 편집 진입 -> 텍스트 삽입 -> 닫기를 한 번에 이어서 실행
+            run = hwp.HAction.Run
+            run("HeaderFooterEdit")
+            _invoke_action(hwp, "InsertText", Text=text)
+            run("CloseEx")
         
-        logger.info(f"{'머리글' if is_header else '바닥글'} 삽입 완료")
+        logger.info("%s 삽입 완료", '머리글' if is_header else '바닥글')
         return f"{'머리글' if is_header else '바닥글'}을 삽입했습니다: {text}"
         
     except Exception as e:
-        logger.error(f"머리글/바닥글 삽입 실패: {e}")
+        logger.error("머리글/바닥글 삽입 실패: %s", e)
         return f"머리글/바닥글 삽입 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def insert_page_break() -> str:
     """페이지 나누기를 삽입합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        act = hwp_controller.hwp.CreateAction("BreakPage")
-        act.Execute()
+        hwp.HAction.Run("BreakPage")
         
         logger.info("페이지 나누기 삽입 완료")
         return "페이지 나누기를 삽입했습니다."
         
     except Exception as e:
-        logger.error(f"페이지 나누기 삽입 실패: {e}")
+        logger.error("페이지 나누기 삽입 실패: %s", e)
         return f"페이지 나누기 삽입 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def merge_table_cells(start_row: int, start_col: int, end_row: int, end_col: int) -> str:
     """표의 셀을 병합합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        hwp_controller.hwp.TableCellBlock(start_row, start_col, end_row, end_col)
+        hwp.TableCellBlock(start_row, start_col, end_row, end_col)
         
-        act = hwp_controller.hwp.CreateAction("TableMergeCell")
-        act.Execute()
+        hwp.HAction.Run("TableMergeCell")
         
-        logger.info(f"셀 병합 완료: ({start_row},{start_col}) ~ ({end_row},{end_col})")
+        logger.info("셀 병합 완료: (%s,%s) ~ (%s,%s)", start_row, start_col, end_row, end_col)
         return f"셀을 병합했습니다: ({start_row},{start_col}) ~ ({end_row},{end_col})"
         
     except Exception as e:
-        logger.error(f"셀 병합 실패: {e}")
+        logger.error("셀 병합 실패: %s", e)
         return f"셀 병합 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def insert_hyperlink(text: str, url: str) -> str:
     """하이퍼링크를 삽입합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        act = hwp_controller.hwp.CreateAction("InsertHyperlink")
-        pset = act.CreateSet()
-        pset.SetItem("Text", text)
-        pset.SetItem("URL", url)
-        act.Execute(pset)
+        _invoke_action(hwp, "InsertHyperlink", Text=text, URL=url)
         
-        logger.info(f"하이퍼링크 삽입 완료: {text} -> {url}")
+        logger.info("하이퍼링크 삽입 완료: %s -> %s", text, url)
         return f"하이퍼링크를 삽입했습니다: {text} -> {url}"
         
     except Exception as e:
-        logger.error(f"하이퍼링크 삽입 실패: {e}")
+        logger.error("하이퍼링크 삽입 실패: %s", e)
         return f"하이퍼링크 삽입 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def create_table_of_contents() -> str:
     """목차를 생성합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        act = hwp_controller.hwp.CreateAction("InsertTableOfContents")
-        pset = act.CreateSet()
-        pset.SetItem("AutoUpdate", True)
-        pset.SetItem("ShowPageNum", True)
-        act.Execute(pset)
+        _invoke_action(hwp, "InsertTableOfContents", AutoUpdate=True, ShowPageNum=True)
         
         logger.info("목차 생성 완료")
         return "목차를 생성했습니다."
         
     except Exception as e:
-        logger.error(f"목차 생성 실패: {e}")
+        logger.error("목차 생성 실패: %s", e)
         return f"목차 생성 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool()
 def apply_heading_style(level: int, text: str) -> str:
     """제목 스타일을 적용합니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        act = hwp_controller.hwp.CreateAction("InsertText")
-        pset = act.CreateSet()
-        pset.SetItem("Text", text)
-        act.Execute(pset)
+        style_name = _HEADING_STYLE_NAMES.get(level) or f"제목 {level}"
+        _invoke_action(hwp, "InsertText", Text=text)
+        _invoke_action(hwp, "StyleApply", StyleName=style_name)
         
-        style_name = f"제목 {level}"
-        act = hwp_controller.hwp.CreateAction("StyleApply")
-        pset = act.CreateSet()
-        pset.SetItem("StyleName", style_name)
-        act.Execute(pset)
-        
-        logger.info(f"제목 스타일 적용 완료: {style_name}")
+        logger.info("제목 스타일 적용 완료: %s", style_name)
         return f"제목 스타일을 적용했습니다: {style_name}"
         
     except Exception as e:
-        logger.error(f"제목 스타일 적용 실패: {e}")
+        logger.error("제목 스타일 적용 실패: %s", e)
         return f"제목 스타일 적용 실패: {e}"
 
-@mcp.tool()
-def export_to_pdf(output_path: str) -> str:
-    """현재 문서를 PDF로 내보냅니다."""
+@_hwp_tool()
+def export_to_pdf(output_path: str, background: bool = False) -> str:
+    """현재 문서를 PDF로 내보냅니다.
+
+    Args:
+        output_path: 저장할 PDF 파일 경로
+        background: True면 작업을 예약하고 바로 작업 ID를 반환합니다. (get_job_status로 확인)
+    """
+    if background:
+        return _submit_job("PDF 내보내기", export_to_pdf, output_path)
+
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        act = hwp_controller.hwp.CreateAction("FileSaveAsPdf")
-        pset = act.CreateSet()
-        pset.SetItem("filename", output_path)
-        pset.SetItem("Format", "PDF")
-        act.Execute(pset)
+        _invoke_action(hwp, "FileSaveAsPdf", filename=output_path, Format="PDF")
         
-        logger.info(f"PDF 내보내기 완료: {output_path}")
+        logger.info("PDF 내보내기 완료: %s", output_path)
         return f"PDF로 내보냈습니다: {output_path}"
         
     except Exception as e:
-        logger.error(f"PDF 내보내기 실패: {e}")
+        logger.error("PDF 내보내기 실패: %s", e)
         return f"PDF 내보내기 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool(coalesce=lambda: "all")
 def get_text_all() -> str:
     """문서 전체의 텍스트를 읽어옵니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
 
-        hwp_controller.hwp.HAction.Run("SelectAll")
-        text = hwp_controller.hwp.GetTextFile("TEXT", "")
-        hwp_controller.hwp.HAction.Run("MoveDocBegin")
+        # 선택 영역과 무관하게 문서 전체를 가져옴 (SelectAll/커서 복원 불필요)
+        # UNICODE 형식은 UTF-16 BSTR 그대로 넘어와 문자셋 변환이 없음
+        text = hwp.GetTextFile("UNICODE", "saveblock:false")
 
         if text is None:
             text = ""
 
-        logger.info(f"전체 텍스트 읽기 완료: {len(text)} 글자")
+        logger.info("전체 텍스트 읽기 완료: %s 글자", len(text))
         return text
         
     except Exception as e:
-        logger.error(f"텍스트 읽기 실패: {e}")
+        logger.error("텍스트 읽기 실패: %s", e)
         return f"텍스트 읽기 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool(coalesce=lambda page_number: ("page", page_number))
 def get_text_by_page(page_number: int) -> str:
     """특정 페이지의 텍스트를 읽어옵니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
 
-        hwp_controller.hwp.HAction.GetDefault("Goto", hwp_controller.hwp.HParameterSet.HGotoE.HSet)
-        hwp_controller.hwp.HParameterSet.HGotoE.PageNumber = page_number
-        hwp_controller.hwp.HAction.Execute("Goto", hwp_controller.hwp.HParameterSet.HGotoE.HSet)
+        with _fast_mode(hwp):
+            text = _read_page_text(hwp, page_number)
 
-        hwp_controller.hwp.HAction.Run("MovePageBegin")
-        hwp_controller.hwp.HAction.Run("MoveSelPageDown")
+        logger.info("%s페이지 텍스트 읽기 완료", page_number)
+        return text
+        
+    except Exception as e:
+        logger.error("페이지 텍스트 읽기 실패: %s", e)
+        return f"페이지 텍스트 읽기 실패: {e}"
 
-        text = hwp_controller.hwp.GetTextFile("TEXT", "")
-        hwp_controller.hwp.HAction.Run("Cancel")
+@_hwp_tool(readonly=True)
+def get_text_by_pages(pages: List[int]) -> str:
+    """여러 페이지의 텍스트를 한 번에 읽어옵니다.
 
-        if text is None:
-            text = ""
+    Args:
+        pages: 읽을 페이지 번호 목록 (1부터 시작)
+    """
+    try:
+        hwp = _require_hwp()
+
+        if not pages:
+            return "읽을 페이지를 지정해주세요."
+
+        page_count = _page_count(hwp)
+        sections = []
+        missing = []
+
+        with _fast_mode(hwp):
+            for page_number in pages:
+                if page_number < 1 or page_number > page_count:
+                    missing.append(str(page_number))
+                    continue
+                text = _read_page_text(hwp, page_number)
+                sections.append(f"[{page_number}페이지]\n{text}")
+
+        result = "\n\n".join(sections)
+        if missing:
+            result += f"\n\n존재하지 않는 페이지: {', '.join(missing)} (총 {page_count}페이지)"
+
+        logger.info("%s개 페이지 텍스트 읽기 완료", len(sections))
+        return result
 
-        logger.info(f"{page_number}페이지 텍스트 읽기 완료")
-        return text
-        
     except Exception as e:
-        logger.error(f"페이지 텍스트 읽기 실패: {e}")
+        logger.error("페이지 텍스트 읽기 실패: %s", e)
         return f"페이지 텍스트 읽기 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def get_selected_text() -> str:
     """현재 선택된 텍스트를 읽어옵니다."""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
 
-        text = hwp_controller.hwp.GetTextFile("TEXT", "")
+        # 선택 영역이 없으면 GetTextFile이 문서 전체를 넘겨주므로 바로 빈 문자열 반환
+        if not hwp.SelectionMode:
+            logger.info("선택된 텍스트 없음")
+            return ""
+
+        text = hwp.GetTextFile("TEXT", "")
 
         if text is None:
             text = ""
 
-        logger.info(f"선택된 텍스트 읽기 완료: {len(text)} 글자")
+        logger.info("선택된 텍스트 읽기 완료: %s 글자", len(text))
         return text
         
     except Exception as e:
-        logger.error(f"선택된 텍스트 읽기 실패: {e}")
+        logger.error("선택된 텍스트 읽기 실패: %s", e)
         return f"선택된 텍스트 읽기 실패: {e}"
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def get_paragraph_text(paragraph_index: int = 0) -> str:
     """특정 문단의 텍스트를 읽어옵니다. (0부터 시작)"""
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
 
-        hwp_controller.hwp.HAction.Run("MoveDocBegin")
+        with _fast_mode(hwp):
+            if not _goto_paragraph(hwp, paragraph_index):
+                return f"{paragraph_index}번째 문단을 찾을 수 없습니다."
 
-        for _ in range(paragraph_index):
-            hwp_controller.hwp.HAction.Run("MoveParaDown")
-
-        hwp_controller.hwp.HAction.Run("MoveSelParaDown")
-        text = hwp_controller.hwp.GetTextFile("TEXT", "")
-        hwp_controller.hwp.HAction.Run("Cancel")
+            hwp.HAction.Run("MoveSelParaDown")
+            text = hwp.GetTextFile("TEXT", "")
+            hwp.HAction.Run("Cancel")
 
-        if text is None:
-            text = ""
+            if text is None:
+                text = ""
 
-        logger.info(f"{paragraph_index}번째 문단 텍스트 읽기 완료")
+        logger.info("%s번째 문단 텍스트 읽기 완료", paragraph_index)
         return text.strip()
         
     except Exception as e:
-        logger.error(f"문단 텍스트 읽기 실패: {e}")
+        logger.error("문단 텍스트 읽기 실패: %s", e)
         return f"문단 텍스트 읽기 실패: {e}"
 
-@mcp.tool()
-def save_as_text(output_path: str) -> str:
-    """문서 전체를 텍스트 파일로 저장합니다."""
+@_hwp_tool(readonly=True)
+def save_as_text(output_path: str, background: bool = False) -> str:
+    """문서 전체를 텍스트 파일로 저장합니다.
+
+    Args:
+        output_path: 저장할 텍스트 파일 경로
+        background: True면 작업을 예약하고 바로 작업 ID를 반환합니다. (get_job_status로 확인)
+    """
+    if background:
+        return _submit_job("텍스트 저장", save_as_text, output_path)
+
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
         
-        hwp_controller.hwp.SaveAs(output_path, "TEXT")
+        hwp.SaveAs(output_path, "TEXT")
         
-        logger.info(f"텍스트 파일로 저장 완료: {output_path}")
+        logger.info("텍스트 파일로 저장 완료: %s", output_path)
         return f"텍스트 파일로 저장했습니다: {output_path}"
         
     except Exception as e:
-        logger.error(f"텍스트 저장 실패: {e}")
+        logger.error("텍스트 저장 실패: %s", e)
+        return f"텍스트 저장 실패: {e}"
+
+@_hwp_tool(readonly=True)
+def save_range_as_text(start_page: int, end_page: int, output_path: str) -> str:
+    """지정한 페이지 범위를 텍스트 파일로 저장합니다. 텍스트를 읽어오지 않고 한글이 직접 파일로 씁니다.
+
+    Args:
+        start_page: 시작 페이지 번호 (1부터 시작)
+        end_page: 끝 페이지 번호 (포함)
+        output_path: 저장할 텍스트 파일 경로
+    """
+    try:
+        hwp = _require_hwp()
+
+        page_count = _page_count(hwp)
+        if start_page < 1 or end_page > page_count or start_page > end_page:
+            return f"잘못된 페이지 범위입니다: {start_page}~{end_page} (총 {page_count}페이지)"
+
+        with _fast_mode(hwp):
+            if not _select_pages(hwp, start_page, end_page, page_count):
+                return f"{start_page}~{end_page}페이지의 시작과 끝이 서로 다른 영역(표 셀 등)에 있어 저장하지 않았습니다."
+
+            hwp.SaveAs(output_path, "TEXT", "saveblock:true")
+            hwp.HAction.Run("Cancel")
+
+        logger.info("%s~%s페이지 텍스트 파일로 저장 완료: %s", start_page, end_page, output_path)
+        return f"{start_page}~{end_page}페이지를 텍스트 파일로 저장했습니다: {output_path}"
+
+    except Exception as e:
+        logger.error("텍스트 저장 실패: %s", e)
         return f"텍스트 저장 실패: {e}"
 
 
@@ -1201,36 +1937,46 @@ def save_as_text(output_path: str) -> str:
 # 고급 분석 및 자동화 기능
 # ============================================================
 
+# 한글 COM을 쓰지 않으므로 작업 스레드를 거치지 않고 바로 응답합니다.
+# (_hwp_tool로 등록하면 조회하려는 작업이 끝날 때까지 같은 큐에서 기다리게 됨)
 @mcp.tool()
+def get_job_status(job_id: str) -> str:
+    """백그라운드로 실행한 작업(export_to_pdf, save_as_text)의 상태를 조회합니다. 끝난 작업은 조회 후 목록에서 제거됩니다."""
+    _prune_jobs()
+
+    job = _JOBS.get(job_id)
+    if job is None:
+        return f"작업을 찾을 수 없습니다: {job_id}"
+
+    name, future, _ = job
+    if not future.done():
+        return f"{name} 작업 진행 중입니다. (작업 ID: {job_id})"
+
+    _JOBS.pop(job_id, None)
+    try:
+        return f"{name} 작업 완료: {future.result()}"
+    except Exception as e:
+        logger.error("%s 작업 실패: %s", name, e)
+        return f"{name} 작업 실패: {e}"
+
+
+@_hwp_tool(readonly=True)
 def get_table_as_csv(table_index: int = 1, output_path: Optional[str] = None) -> str:
     """
     특정 표를 CSV 형식으로 추출합니다. (1부터 시작)
     output_path를 지정하면 파일로 저장, 아니면 텍스트로 반환합니다.
     """
     try:
-        hwp_controller.check_initialization()
+        hwp = _require_hwp()
+        run = hwp.HAction.Run
         
-        hwp = hwp_controller.hwp
-        current_table = 0
+        run("MoveDocBegin")
         
-        hwp.HAction.Run("MoveDocBegin")
-        
-        ctrl = hwp.HeadCtrl
-        target_ctrl = None
-        
-        while ctrl:
-            try:
-                if ctrl.CtrlID == 'tbl':
-                    current_table += 1
-                    if current_table == table_index:
-                        target_ctrl = ctrl
-                        break
-                ctrl = ctrl.Next
-            except:
-                break
+        tables = _control_index(hwp).get('tbl', [])
+        if not 1 <= table_index <= len(tables):
+            return f"{table_index}번째 표를 찾을 수 없습니다. (총 {len(tables)}개 표 존재)"
         
-        if not target_ctrl:
-            return f"{table_index}번째 표를 찾을 수 없습니다. (총 {current_table}개 표 존재)"
+        target_ctrl = tables[table_index - 1]
         
         rows = 0
         cols = 0
@@ -1244,10 +1990,10 @@ def get_table_as_csv(table_index: int = 1, output_path: Optional[str] = None) ->
         cell_contents = []
         try:
             hwp.SetPosBySet(target_ctrl.GetAnchorPos(0))
-            hwp.HAction.Run("ShapeObjTableSelCell")
-            hwp.HAction.Run("TableColBegin")
-            hwp.HAction.Run("TableRowBegin")
-            hwp.HAction.Run("TableCellBlockExtendAll")
+            run("ShapeObjTableSelCell")
+            run("TableColBegin")
+            run("TableRowBegin")
+            run("TableCellBlockExtendAll")
             
             table_text = hwp.GetTextFile("TEXT", "")
 
@@ -1255,92 +2001,131 @@ def get_table_as_csv(table_index: int = 1, output_path: Optional[str] = None) ->
                 table_text = ""
 
             if table_text:
-                cell_contents = [t.strip() for t in table_text.split('\r\n') if t.strip()]
+                cell_contents = [t for t in map(str.strip, table_text.split('\r\n')) if t]
             
-            hwp.HAction.Run("Cancel")
+            run("Cancel")
             
         except Exception as e:
-            logger.warning(f"표 내용 추출 중 오류: {e}")
+            logger.warning("표 내용 추출 중 오류: %s", e)
             return f"표 내용 추출 실패: {e}"
         
-        csv_lines = []
+        # 행 단위로 만들어 csv.writer에 바로 넘김 (따옴표 처리는 csv 모듈이 담당)
         if rows > 0 and cols > 0 and len(cell_contents) >= rows * cols:
-            for r in range(rows):
-                row_data = []
-                for c in range(cols):
-                    idx = r * cols + c
-                    if idx < len(cell_contents):
-                        cell = cell_contents[idx].replace('"', '""')
-                        if ',' in cell or '"' in cell or '\n' in cell:
-                            cell = f'"{cell}"'
-                        row_data.append(cell)
-                csv_lines.append(','.join(row_data))
+            csv_rows = (cell_contents[r * cols:(r + 1) * cols] for r in range(rows))
         else:
-            for cell in cell_contents:
-                cell = cell.replace('"', '""')
-                if ',' in cell or '"' in cell:
-                    cell = f'"{cell}"'
-                csv_lines.append(cell)
-        
-        csv_content = '\n'.join(csv_lines)
+            csv_rows = ([cell] for cell in cell_contents)
         
         if output_path:
-            with open(output_path, 'w', encoding='utf-8-sig') as f:
-                f.write(csv_content)
-            logger.info(f"표 {table_index} CSV 저장 완료: {output_path}")
+            with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
+                csv.writer(f).writerows(csv_rows)
+            logger.info("표 %s CSV 저장 완료: %s", table_index, output_path)
             return f"표 {table_index}을(를) CSV로 저장했습니다: {output_path}\n({rows}행 x {cols}열, {len(cell_contents)}개 셀)"
         else:
-            logger.info(f"표 {table_index} CSV 추출 완료")
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator='\n').writerows(csv_rows)
+            csv_content = buffer.getvalue().rstrip('\n')
+            logger.info("표 %s CSV 추출 완료", table_index)
             return f"표 {table_index} CSV 내용 ({rows}행 x {cols}열):\n\n{csv_content}"
         
     except Exception as e:
-        logger.error(f"표 CSV 추출 실패: {e}")
+        logger.error("표 CSV 추출 실패: %s", e)
         return f"표 CSV 추출 실패: {e}"
 
 
-@mcp.tool()
-def batch_replace(replacements: str) -> str:
+def _batch_replace_text(hwp, pairs: List[str]) -> str:
+    """
+    batch_replace의 빠른 경로: 전체 텍스트에 대해 정규식 한 번으로 모든 항목을 바꿉니다.
+    순서에 의존하지 않으므로 앞 항목의 결과가 뒤 항목에 다시 바뀌지 않습니다.
+    """
+    results = []
+    mapping = {}
+
+    for pair in pairs:
+        if '->' not in pair:
+            results.append(f"! '{pair}': 잘못된 형식 (->로 구분 필요)")
+            continue
+
+        find_text, replace_text = (part.strip() for part in pair.split('->', 1))
+
+        if not find_text:
+            results.append(f"! 빈 검색어는 건너뜁니다")
+            continue
+
+        mapping.setdefault(find_text, replace_text)
+
+    with _fast_mode(hwp):
+        full_text = hwp.GetTextFile("UNICODE", "saveblock:false") or ""
+        new_text, hits = multi_replace(full_text, mapping)
+
+        if new_text != full_text:
+            run = hwp.HAction.Run
+            run("SelectAll")
+            run("Delete")
+            _invoke_action(hwp, "InsertText", Text=new_text)
+            run("MoveDocBegin")
+
+    total_replaced = 0
+    for find_text, count in hits.items():
+        if count:
+            results.append(f"O '{find_text}' -> '{mapping[find_text]}': {count}건 완료")
+            total_replaced += 1
+        else:
+            results.append(f"- '{find_text}': 찾을 수 없음")
+
+    result = f"""일괄 바꾸기 결과 (빠른 모드)
+==============================
+총 {len(pairs)}개 항목 중 {total_replaced}개 처리 완료
+
+"""
+    result += '\n'.join(results)
+
+    logger.info("일괄 바꾸기(빠른 모드) 완료: %s/%s개", total_replaced, len(pairs))
+    return result
+
+@_hwp_tool()
+def batch_replace(replacements: str, fast: bool = False) -> str:
     """
     여러 텍스트를 한번에 바꿉니다.
     replacements: "찾을텍스트1->바꿀텍스트1, 찾을텍스트2->바꿀텍스트2" 형식
     예: "주식회사->㈜, 2023년->2024년, 홍길동->김철수"
+    fast: True이면 문서 텍스트를 한 번 읽어 모든 항목을 한 번에 바꾼 뒤 다시 씁니다.
+          (항목 수와 무관하게 1회 처리되지만 글자/문단 서식과 표 등 개체는 유지되지 않음)
     """
     try:
-        hwp_controller.check_initialization()
-        
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
         
         pairs = [p.strip() for p in replacements.split(',')]
+        
+        if fast:
+            return _batch_replace_text(hwp, pairs)
+        
         results = []
         total_replaced = 0
         
-        for pair in pairs:
-            if '->' not in pair:
-                results.append(f"! '{pair}': 잘못된 형식 (->로 구분 필요)")
-                continue
+        with _fast_mode(hwp):
+            for pair in pairs:
+                if '->' not in pair:
+                    results.append(f"! '{pair}': 잘못된 형식 (->로 구분 필요)")
+                    continue
             
-            parts = pair.split('->', 1)
-            find_text = parts[0].strip()
-            replace_text = parts[1].strip()
+                parts = pair.split('->', 1)
+                find_text = parts[0].strip()
+                replace_text = parts[1].strip()
             
-            if not find_text:
-                results.append(f"! 빈 검색어는 건너뜁니다")
-                continue
+                if not find_text:
+                    results.append(f"! 빈 검색어는 건너뜁니다")
+                    continue
             
-            hwp.HAction.Run("MoveDocBegin")
-
-            hwp.HAction.GetDefault("AllReplace", hwp.HParameterSet.HFindReplace.HSet)
-            hwp.HParameterSet.HFindReplace.FindString = find_text
-            hwp.HParameterSet.HFindReplace.ReplaceString = replace_text
-            hwp.HParameterSet.HFindReplace.ReplaceMode = 1
+                # AllReplace는 커서 위치부터 검색하므로 항목마다 문서 처음에서 시작
+                hwp.HAction.Run("MoveDocBegin")
 
-            execute_result = hwp.HAction.Execute("AllReplace", hwp.HParameterSet.HFindReplace.HSet)
+                execute_result = _find_replace(hwp, "AllReplace", find_text, replace_text)
             
-            if execute_result:
-                results.append(f"O '{find_text}' -> '{replace_text}': 완료")
-                total_replaced += 1
-            else:
-                results.append(f"- '{find_text}': 찾을 수 없음")
+                if execute_result:
+                    results.append(f"O '{find_text}' -> '{replace_text}': 완료")
+                    total_replaced += 1
+                else:
+                    results.append(f"- '{find_text}': 찾을 수 없음")
         
         result = f"""일괄 바꾸기 결과
 ==============================
@@ -1349,15 +2134,15 @@ def batch_replace(replacements: str) -> str:
 """
         result += '\n'.join(results)
         
-        logger.info(f"일괄 바꾸기 완료: {total_replaced}/{len(pairs)}개")
+        logger.info("일괄 바꾸기 완료: %s/%s개", total_replaced, len(pairs))
         return result
         
     except Exception as e:
-        logger.error(f"일괄 바꾸기 실패: {e}")
+        logger.error("일괄 바꾸기 실패: %s", e)
         return f"일괄 바꾸기 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def find_text(search_text: str, show_context: bool = True) -> str:
     """
     문서에서 특정 텍스트를 찾아 위치와 주변 내용을 반환합니다.
@@ -1365,9 +2150,7 @@ def find_text(search_text: str, show_context: bool = True) -> str:
     show_context: True면 주변 텍스트도 함께 표시
     """
     try:
-        hwp_controller.check_initialization()
-        
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
         
         hwp.HAction.Run("SelectAll")
         full_text = hwp.GetTextFile("TEXT", "")
@@ -1379,35 +2162,15 @@ def find_text(search_text: str, show_context: bool = True) -> str:
         if not full_text:
             return "문서에 내용이 없습니다."
         
-        search_lower = search_text.lower()
-        text_lower = full_text.lower()
-        
-        positions = []
-        start = 0
-        while True:
-            pos = text_lower.find(search_lower, start)
-            if pos == -1:
-                break
-            positions.append(pos)
-            start = pos + 1
+        # 겹치는 위치까지 모두 찾고 각 위치의 줄 번호를 함께 구함
+        positions = find_positions(full_text, search_text)
         
         if not positions:
             return f"'{search_text}'을(를) 찾을 수 없습니다."
         
-        lines = full_text.split('\r\n')
         results = []
         
-        for i, pos in enumerate(positions, 1):
-            current_pos = 0
-            line_num = 0
-            
-            for idx, line in enumerate(lines):
-                line_end = current_pos + len(line)
-                if current_pos <= pos < line_end + 2:
-                    line_num = idx + 1
-                    break
-                current_pos = line_end + 2
-            
+        for i, (pos, line_num) in enumerate(positions, 1):
             estimated_page = (line_num // 50) + 1
             
             if show_context:
@@ -1433,15 +2196,15 @@ def find_text(search_text: str, show_context: bool = True) -> str:
 """
         result += '\n\n'.join(results)
         
-        logger.info(f"텍스트 검색 완료: '{search_text}' - {len(positions)}개 발견")
+        logger.info("텍스트 검색 완료: '%s' - %s개 발견", search_text, len(positions))
         return result
         
     except Exception as e:
-        logger.error(f"텍스트 검색 실패: {e}")
+        logger.error("텍스트 검색 실패: %s", e)
         return f"텍스트 검색 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool()
 def fill_template(field_values: str) -> str:
     """
     문서의 필드(플레이스홀더)를 값으로 채웁니다.
@@ -1451,55 +2214,58 @@ def fill_template(field_values: str) -> str:
     예: "이름=홍길동, 날짜=2024-01-01, 금액=1,000,000원"
     """
     try:
-        hwp_controller.check_initialization()
-        
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
         
         pairs = [p.strip() for p in field_values.split(',')]
         results = []
         total_filled = 0
         
-        for pair in pairs:
-            if '=' not in pair:
-                results.append(f"! '{pair}': 잘못된 형식 (=로 구분 필요)")
-                continue
+        with _fast_mode(hwp):
+            # 문서에 없는 자리표시자는 AllReplace를 실행하지 않도록 본문을 한 번 읽어 둠
+            # (찾기는 대소문자를 구별하지 않을 수 있으므로 casefold로 비교)
+            present_text = (hwp.GetTextFile("UNICODE", "saveblock:false") or "").casefold()
             
-            parts = pair.split('=', 1)
-            field_name = parts[0].strip()
-            field_value = parts[1].strip()
+            for pair in pairs:
+                if '=' not in pair:
+                    results.append(f"! '{pair}': 잘못된 형식 (=로 구분 필요)")
+                    continue
             
-            if not field_name:
-                results.append(f"! 빈 필드명은 건너뜁니다")
-                continue
+                parts = pair.split('=', 1)
+                field_name = parts[0].strip()
+                field_value = parts[1].strip()
             
-            placeholders = [
-                "{{" + field_name + "}}",
-                "{" + field_name + "}",
-                "[" + field_name + "]",
-                "<" + field_name + ">",
-                "$" + field_name + "$",
-                field_name
-            ]
+                if not field_name:
+                    results.append(f"! 빈 필드명은 건너뜁니다")
+                    continue
             
-            replaced = False
-            for placeholder in placeholders:
-                hwp.HAction.Run("MoveDocBegin")
-                
-                hwp.HAction.GetDefault("AllReplace", hwp.HParameterSet.HFindReplace.HSet)
-                hwp.HParameterSet.HFindReplace.FindString = placeholder
-                hwp.HParameterSet.HFindReplace.ReplaceString = field_value
-                hwp.HParameterSet.HFindReplace.ReplaceMode = 1
+                placeholders = [
+                    "{{" + field_name + "}}",
+                    "{" + field_name + "}",
+                    "[" + field_name + "]",
+                    "<" + field_name + ">",
+                    "$" + field_name + "$",
+                    field_name
+                ]
+            
+                replaced = False
+                for placeholder in placeholders:
+                    if placeholder.casefold() not in present_text:
+                        continue
+                    
+                    hwp.HAction.Run("MoveDocBegin")
                 
-                execute_result = hwp.HAction.Execute("AllReplace", hwp.HParameterSet.HFindReplace.HSet)
+                    execute_result = _find_replace(hwp, "AllReplace", placeholder, field_value)
                 
-                if execute_result:
-                    results.append(f"O {placeholder} -> '{field_value}': 완료")
-                    total_filled += 1
-                    replaced = True
-                    break
+                    if execute_result:
+                        results.append(f"O {placeholder} -> '{field_value}': 완료")
+                        total_filled += 1
+                        replaced = True
+                        # 넣은 값 안의 자리표시자도 이후 항목에서 찾을 수 있도록 추가
+                        present_text += "\n" + field_value.casefold()
+                        break
             
-            if not replaced:
-                results.append(f"- '{field_name}': 해당 필드를 찾을 수 없음")
+                if not replaced:
+                    results.append(f"- '{field_name}': 해당 필드를 찾을 수 없음")
         
         result = f"""템플릿 채우기 결과
 ==============================
@@ -1511,91 +2277,46 @@ def fill_template(field_values: str) -> str:
         if total_filled < len(pairs):
             result += "\n\n팁: 문서에서 필드는 {{이름}}, {이름}, [이름] 등의 형식으로 작성해주세요."
         
-        logger.info(f"템플릿 채우기 완료: {total_filled}/{len(pairs)}개")
+        logger.info("템플릿 채우기 완료: %s/%s개", total_filled, len(pairs))
         return result
         
     except Exception as e:
-        logger.error(f"템플릿 채우기 실패: {e}")
+        logger.error("템플릿 채우기 실패: %s", e)
         return f"템플릿 채우기 실패: {e}"
 
 
-@mcp.tool()
-def get_document_structure() -> str:
+@_hwp_tool(readonly=True)
+def get_document_structure(include_headings: bool = True, include_text_stats: bool = True) -> str:
     """
     문서의 전체 구조를 분석합니다. (페이지 수, 문단 수, 표 개수, 이미지 개수, 제목/개요 구조)
+    include_headings: False면 제목/개요 분석을 건너뜁니다.
+    include_text_stats: False면 문단 수/글자 수를 건너뜁니다. (둘 다 False면 본문 텍스트를 읽지 않음)
     """
     try:
-        hwp_controller.check_initialization()
-        
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
         
-        page_count = hwp.PageCount
+        page_count = _page_count(hwp)
         
-        doc_path = "(새 문서)"
+        active_path = ""
         try:
-            if hwp.XHwpDocuments.Count > 0:
-                active_doc = hwp.XHwpDocuments.Item(0)
-                if active_doc.Path:
-                    doc_path = active_doc.Path
+            docs = hwp.XHwpDocuments
+            if docs.Count > 0:
+                active_path = docs.Item(0).Path or ""
         except:
             pass
         
-        doc_name = doc_path.split("\\")[-1] if doc_path != "(새 문서)" else "새 문서"
-        
-        hwp.HAction.Run("SelectAll")
-        full_text = hwp.GetTextFile("TEXT", "")
-        hwp.HAction.Run("MoveDocBegin")
-
-        if full_text is None:
-            full_text = ""
-
-        char_count = len(full_text.replace('\r\n', '').replace(' ', '')) if full_text else 0
-        paragraph_count = full_text.count('\r\n') + 1 if full_text else 0
+        doc_path = active_path or "(새 문서)"
+        doc_name = ntpath.basename(active_path) if active_path else "새 문서"
         
-        table_count = 0
-        image_count = 0
-        shape_count = 0
+        (char_count, paragraph_count, table_count, image_count, shape_count,
+         headings) = _document_stats(hwp, active_path, include_text_stats, include_headings)
         
-        ctrl = hwp.HeadCtrl
-        while ctrl:
-            try:
-                ctrl_code = ctrl.CtrlID
-                if ctrl_code == 'tbl':
-                    table_count += 1
-                elif ctrl_code in ['ole', 'pic']:
-                    image_count += 1
-                elif ctrl_code == 'gso':
-                    shape_count += 1
-                ctrl = ctrl.Next
-            except:
-                break
-        
-        headings = []
-        lines = full_text.split('\r\n') if full_text else []
-        
-        heading_patterns = [
-            (r'^\s*([IVX]+)\.\s*(.+)$', 1, "로마자"),
-            (r'^\s*(\d+)\.\s*(.+)$', 2, "숫자"),
-            (r'^\s*([가-힣])\.\s*(.+)$', 3, "가나다"),
-            (r'^\s*\((\d+)\)\s*(.+)$', 3, "괄호숫자"),
-            (r'^\s*(제\s*\d+\s*[장절조항])\s*(.*)$', 1, "장절"),
-            (r'^\s*(붙임|별첨|부록)\s*[\d]*\.?\s*(.*)$', 1, "붙임"),
-        ]
-        
-        for i, line in enumerate(lines[:200]):
-            line_stripped = line.strip()
-            if not line_stripped or len(line_stripped) > 100:
-                continue
-            
-            for pattern, level, ptype in heading_patterns:
-                if re.match(pattern, line_stripped):
-                    headings.append({
-                        "line": i + 1,
-                        "level": level,
-                        "text": line_stripped[:60] + ("..." if len(line_stripped) > 60 else ""),
-                        "type": ptype
-                    })
-                    break
+        if include_text_stats:
+            stats_block = f"""  - 총 문단: {paragraph_count}개 (추정)
+  - 총 글자: {char_count:,}자 (공백 제외)
+"""
+        else:
+            stats_block = ""
         
         result = f"""문서 구조 분석 결과
 {'='*50}
@@ -1603,9 +2324,7 @@ def get_document_structure() -> str:
 기본 정보:
   - 파일명: {doc_name}
   - 총 페이지: {page_count}페이지
-  - 총 문단: {paragraph_count}개 (추정)
-  - 총 글자: {char_count:,}자 (공백 제외)
-
+{stats_block}
 포함된 요소:
   - 표(테이블): {table_count}개
   - 이미지/그림: {image_count}개
@@ -1613,22 +2332,21 @@ def get_document_structure() -> str:
 """
         
         if headings:
-            result += f"\n문서 개요 구조 ({len(headings)}개 항목):\n"
-            for h in headings[:20]:
-                indent = "  " * h['level']
-                result += f"{indent}- {h['text']}\n"
+            outline = [f"\n문서 개요 구조 ({len(headings)}개 항목):"]
+            outline.extend(f"{'  ' * h['level']}- {h['text']}" for h in headings[:20])
             if len(headings) > 20:
-                result += f"  ... 외 {len(headings) - 20}개 항목\n"
-        else:
+                outline.append(f"  ... 외 {len(headings) - 20}개 항목")
+            result += "\n".join(outline) + "\n"
+        elif include_headings:
             result += "\n문서 개요: (번호 체계 없음)\n"
         
         result += f"\n{'='*50}"
         
-        logger.info(f"문서 구조 분석 완료: {doc_name}")
+        logger.info("문서 구조 분석 완료: %s", doc_name)
         return result
         
     except Exception as e:
-        logger.error(f"문서 구조 분석 실패: {e}")
+        logger.error("문서 구조 분석 실패: %s", e)
         return f"문서 구조 분석 실패: {e}"
 
 
@@ -1636,61 +2354,54 @@ def get_document_structure() -> str:
 # 개선된 위치 제어 및 편집 기능
 # ============================================================
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def move_to_page(page_number: int) -> str:
     """
     특정 페이지로 커서를 이동합니다.
     page_number: 이동할 페이지 번호 (1부터 시작)
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
-        total_pages = hwp.PageCount
+        total_pages = _page_count(hwp)
         if page_number < 1 or page_number > total_pages:
             return f"페이지 번호가 범위를 벗어났습니다. (1~{total_pages})"
 
-        hwp.HAction.GetDefault("Goto", hwp.HParameterSet.HGotoE.HSet)
-        hwp.HParameterSet.HGotoE.PageNumber = page_number
-        hwp.HAction.Execute("Goto", hwp.HParameterSet.HGotoE.HSet)
+        _goto_page(hwp, page_number)
 
-        logger.info(f"{page_number}페이지로 이동 완료")
+        logger.info("%s페이지로 이동 완료", page_number)
         return f"{page_number}페이지로 이동했습니다."
 
     except Exception as e:
-        logger.error(f"페이지 이동 실패: {e}")
+        logger.error("페이지 이동 실패: %s", e)
         return f"페이지 이동 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def move_to_paragraph_number(paragraph_number: int) -> str:
     """
     특정 문단으로 커서를 이동합니다. (0부터 시작)
     paragraph_number: 이동할 문단 번호
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
-        hwp.HAction.Run("MoveDocBegin")
+        if not _goto_paragraph(hwp, paragraph_number):
+            return f"{paragraph_number}번째 문단을 찾을 수 없습니다."
 
-        for i in range(paragraph_number):
-            hwp.HAction.Run("MoveParaDown")
-
-        logger.info(f"{paragraph_number}번째 문단으로 이동 완료")
+        logger.info("%s번째 문단으로 이동 완료", paragraph_number)
         return f"{paragraph_number}번째 문단으로 이동했습니다."
 
     except Exception as e:
-        logger.error(f"문단 이동 실패: {e}")
+        logger.error("문단 이동 실패: %s", e)
         return f"문단 이동 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def move_to_document_end() -> str:
     """문서의 끝으로 커서를 이동합니다."""
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         hwp.HAction.Run("MoveDocEnd")
 
@@ -1698,16 +2409,15 @@ def move_to_document_end() -> str:
         return "문서 끝으로 이동했습니다."
 
     except Exception as e:
-        logger.error(f"문서 끝 이동 실패: {e}")
+        logger.error("문서 끝 이동 실패: %s", e)
         return f"문서 끝 이동 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def move_to_document_start() -> str:
     """문서의 시작으로 커서를 이동합니다."""
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         hwp.HAction.Run("MoveDocBegin")
 
@@ -1715,7 +2425,7 @@ def move_to_document_start() -> str:
         return "문서 시작으로 이동했습니다."
 
     except Exception as e:
-        logger.error(f"문서 시작 이동 실패: {e}")
+        logger.error("문서 시작 이동 실패: %s", e)
         return f"문서 시작 이동 실패: {e}"
 
 
@@ -1723,12 +2433,11 @@ def move_to_document_start() -> str:
 # 텍스트 삭제 기능
 # ============================================================
 
-@mcp.tool()
+@_hwp_tool()
 def delete_selected_text() -> str:
     """현재 선택된 텍스트를 삭제합니다."""
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         # 선택된 텍스트 확인
         selected_text = hwp.GetTextFile("TEXT", "")
@@ -1741,78 +2450,70 @@ def delete_selected_text() -> str:
         # Delete 키 실행
         hwp.HAction.Run("Delete")
 
-        logger.info(f"선택된 텍스트 삭제 완료: {len(selected_text)}자")
+        logger.info("선택된 텍스트 삭제 완료: %s자", len(selected_text))
         return f"선택된 텍스트를 삭제했습니다. ({len(selected_text)}자)"
 
     except Exception as e:
-        logger.error(f"선택 텍스트 삭제 실패: {e}")
+        logger.error("선택 텍스트 삭제 실패: %s", e)
         return f"선택 텍스트 삭제 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool()
 def delete_all_occurrences(text: str) -> str:
     """
     문서에서 특정 텍스트를 모두 찾아서 삭제합니다.
     text: 삭제할 텍스트
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         if not text:
             return "삭제할 텍스트를 지정해주세요."
 
         # find_and_replace의 로직을 사용하여 모두 삭제
-        hwp.HAction.Run("MoveDocBegin")
-
-        hwp.HAction.GetDefault("AllReplace", hwp.HParameterSet.HFindReplace.HSet)
-        hwp.HParameterSet.HFindReplace.FindString = text
-        hwp.HParameterSet.HFindReplace.ReplaceString = ""
-        hwp.HParameterSet.HFindReplace.ReplaceMode = 1  # 모두 바꾸기
-
-        result = hwp.HAction.Execute("AllReplace", hwp.HParameterSet.HFindReplace.HSet)
+        with _fast_mode(hwp):
+            hwp.HAction.Run("MoveDocBegin")
+            result = _find_replace(hwp, "AllReplace", text, "")
 
         if result:
-            logger.info(f"'{text}' 모두 삭제 완료")
+            logger.info("'%s' 모두 삭제 완료", text)
             return f"'{text}'를 모두 삭제했습니다."
         else:
             return f"'{text}'를 찾을 수 없습니다."
 
     except Exception as e:
-        logger.error(f"텍스트 삭제 실패: {e}")
+        logger.error("텍스트 삭제 실패: %s", e)
         return f"텍스트 삭제 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool()
 def delete_current_line() -> str:
     """현재 커서가 있는 줄 전체를 삭제합니다."""
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
+        run = hwp.HAction.Run
         # 줄 시작으로 이동
-        hwp.HAction.Run("MoveLineBegin")
-        # 줄 끝까지 선택
-        hwp.HAction.Run("MoveSelLineEnd")
-        # 삭제
-        hwp.HAction.Run("Delete")
-        # 줄바꿈도 삭제 (다음 줄과 합쳐짐)
-        hwp.HAction.Run("Delete")
+        run("MoveLineBegin")
+        # 줄 끝까지 선택하고 줄바꿈 한 글자까지 선택을 넓힘 (다음 줄과 합쳐짐)
+        run("MoveSelLineEnd")
+        run("MoveSelNextChar")
+        # 한 번에 삭제
+        run("Delete")
 
         logger.info("현재 줄 삭제 완료")
         return f"현재 줄을 삭제했습니다."
 
     except Exception as e:
-        logger.error(f"줄 삭제 실패: {e}")
+        logger.error("줄 삭제 실패: %s", e)
         return f"줄 삭제 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool()
 def delete_current_paragraph() -> str:
     """현재 커서가 있는 문단 전체를 삭제합니다."""
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         # 문단 선택
         hwp.HAction.Run("MoveSelParaDown")
@@ -1823,135 +2524,140 @@ def delete_current_paragraph() -> str:
         return "현재 문단을 삭제했습니다."
 
     except Exception as e:
-        logger.error(f"문단 삭제 실패: {e}")
+        logger.error("문단 삭제 실패: %s", e)
         return f"문단 삭제 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool()
 def delete_page_content(page_number: int) -> str:
     """
     특정 페이지의 모든 내용을 삭제합니다.
     page_number: 삭제할 페이지 번호 (1부터 시작)
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
-        total_pages = hwp.PageCount
+        total_pages = _page_count(hwp)
         if page_number < 1 or page_number > total_pages:
             return f"페이지 번호가 범위를 벗어났습니다. (1~{total_pages})"
 
-        # 페이지로 이동
-        hwp.HAction.GetDefault("Goto", hwp.HParameterSet.HGotoE.HSet)
-        hwp.HParameterSet.HGotoE.PageNumber = page_number
-        hwp.HAction.Execute("Goto", hwp.HParameterSet.HGotoE.HSet)
+        with _fast_mode(hwp):
+            # 페이지로 이동 (캐시된 Goto 핸들 사용)
+            _goto_page(hwp, page_number)
 
-        # 페이지 시작으로 이동
-        hwp.HAction.Run("MovePageBegin")
-        # 페이지 전체 선택
-        hwp.HAction.Run("MoveSelPageDown")
-        # 삭제
-        hwp.HAction.Run("Delete")
+            run = hwp.HAction.Run
+            # 페이지 시작으로 이동
+            run("MovePageBegin")
+            # 페이지 전체 선택
+            run("MoveSelPageDown")
+            # 삭제
+            run("Delete")
 
-        logger.info(f"{page_number}페이지 내용 삭제 완료")
+        logger.info("%s페이지 내용 삭제 완료", page_number)
         return f"{page_number}페이지의 내용을 삭제했습니다."
 
     except Exception as e:
-        logger.error(f"페이지 삭제 실패: {e}")
+        logger.error("페이지 삭제 실패: %s", e)
         return f"페이지 삭제 실패: {e}"
 
 
+@_hwp_tool()
+def delete_page_range(start_page: int, end_page: int) -> str:
+    """
+    여러 페이지의 내용을 한 번에 삭제합니다.
+    start_page: 시작 페이지 번호 (1부터 시작)
+    end_page: 끝 페이지 번호 (포함)
+    """
+    try:
+        hwp = _require_hwp()
+
+        total_pages = _page_count(hwp)
+        if start_page < 1 or end_page > total_pages or start_page > end_page:
+            return f"잘못된 페이지 범위입니다: {start_page}~{end_page} (총 {total_pages}페이지)"
+
+        with _fast_mode(hwp):
+            # 범위를 한 번에 선택해서 한 번에 삭제
+            if not _select_pages(hwp, start_page, end_page, total_pages):
+                return f"{start_page}~{end_page}페이지의 시작과 끝이 서로 다른 영역(표 셀 등)에 있어 삭제하지 않았습니다."
+            hwp.HAction.Run("Delete")
+
+        logger.info("%s~%s페이지 내용 삭제 완료", start_page, end_page)
+        return f"{start_page}~{end_page}페이지의 내용을 삭제했습니다."
+
+    except Exception as e:
+        logger.error("페이지 범위 삭제 실패: %s", e)
+        return f"페이지 범위 삭제 실패: {e}"
+
+
 # ============================================================
 # 서식 유지 및 가져오기 기능
 # ============================================================
 
-@mcp.tool()
+# get_current_char_shape 결과 형식
+_CHAR_SHAPE_TEMPLATE = """현재 위치의 글자 서식:
+- 글꼴: {}
+- 크기: {}pt
+- 굵게: {}
+- 기울임: {}
+- 밑줄: {}
+- 색상: RGB({}, {}, {})"""
+_YES_NO = ("아니오", "예")
+
+@_hwp_tool(readonly=True)
 def get_current_char_shape() -> str:
     """
     현재 커서 위치의 글자 서식 정보를 가져옵니다.
     (글꼴, 크기, 굵기, 기울임, 밑줄, 색상 등)
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         # CharShape 정보 가져오기
         pset = hwp.HParameterSet.HCharShape
         hwp.HAction.GetDefault("CharShape", pset.HSet)
 
-        # 서식 정보 추출 (직접 속성 접근)
-        try:
-            font_name = pset.FaceNameHangul if hasattr(pset, 'FaceNameHangul') and pset.FaceNameHangul else "알 수 없음"
-        except:
-            font_name = "알 수 없음"
-
-        try:
-            font_size = pset.Height // 100 if hasattr(pset, 'Height') and pset.Height else 0
-        except:
-            font_size = 0
-
-        try:
-            is_bold = bool(pset.Bold) if hasattr(pset, 'Bold') else False
-        except:
-            is_bold = False
-
-        try:
-            is_italic = bool(pset.Italic) if hasattr(pset, 'Italic') else False
-        except:
-            is_italic = False
-
-        try:
-            is_underline = bool(pset.Underline) if hasattr(pset, 'Underline') else False
-        except:
-            is_underline = False
-
-        try:
-            text_color = pset.TextColor if hasattr(pset, 'TextColor') else 0x000000
-        except:
-            text_color = 0x000000
+        # 서식 정보 추출 (속성마다 한 번만 읽고, 없으면 기본값)
+        font_name = _com_get(pset, 'FaceNameHangul') or "알 수 없음"
+        font_size = _com_get(pset, 'Height', 0) // 100
+        is_bold = bool(_com_get(pset, 'Bold', False))
+        is_italic = bool(_com_get(pset, 'Italic', False))
+        is_underline = bool(_com_get(pset, 'Underline', False))
+        text_color = _com_get(pset, 'TextColor', 0x000000)
 
-        # 색상을 RGB로 변환
-        r = text_color & 0xFF
-        g = (text_color >> 8) & 0xFF
-        b = (text_color >> 16) & 0xFF
+        # 색상을 RGB로 변환 (한글 색상값은 0x00BBGGRR)
+        r, g, b, _ = (text_color & 0xFFFFFFFF).to_bytes(4, 'little')
 
-        result = f"""현재 위치의 글자 서식:
-- 글꼴: {font_name}
-- 크기: {font_size}pt
-- 굵게: {'예' if is_bold else '아니오'}
-- 기울임: {'예' if is_italic else '아니오'}
-- 밑줄: {'예' if is_underline else '아니오'}
-- 색상: RGB({r}, {g}, {b})"""
+        result = _CHAR_SHAPE_TEMPLATE.format(
+            font_name, font_size,
+            _YES_NO[is_bold], _YES_NO[is_italic], _YES_NO[is_underline],
+            r, g, b,
+        )
 
         logger.info("글자 서식 정보 조회 완료")
         return result
 
     except Exception as e:
-        logger.error(f"서식 정보 조회 실패: {e}")
+        logger.error("서식 정보 조회 실패: %s", e)
         return f"서식 정보 조회 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool()
 def insert_text_preserving_format(text: str) -> str:
     """
     현재 위치의 서식을 유지하면서 텍스트를 삽입합니다.
     한글의 기본 동작이 서식을 유지하므로, 단순 삽입으로 동작합니다.
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         # 한글은 기본적으로 현재 위치의 서식을 유지하면서 텍스트를 삽입함
-        act = hwp.CreateAction("InsertText")
-        pset = act.CreateSet()
-        pset.SetItem("Text", text)
-        act.Execute(pset)
+        _invoke_action(hwp, "InsertText", Text=text)
 
-        logger.info(f"서식 유지 텍스트 삽입 완료: {text[:50]}...")
+        logger.info("서식 유지 텍스트 삽입 완료: %s...", text[:50])
         return f"서식을 유지하면서 텍스트를 삽입했습니다: {text[:50]}..."
 
     except Exception as e:
-        logger.error(f"서식 유지 삽입 실패: {e}")
+        logger.error("서식 유지 삽입 실패: %s", e)
         return f"서식 유지 삽입 실패: {e}"
 
 
@@ -1959,7 +2665,23 @@ def insert_text_preserving_format(text: str) -> str:
 # 고급 삽입 기능 (특정 위치에 삽입)
 # ============================================================
 
-@mcp.tool()
+def _find_nth(hwp, search_text, nth):
+    """
+    문서 처음부터 search_text를 nth번째 발견까지 찾아 선택합니다. 실제로 찾은 횟수를 반환합니다.
+    대부분의 호출인 첫 번째 발견은 반복 없이 한 번만 찾습니다.
+    """
+    hwp.HAction.Run("MoveDocBegin")
+
+    if nth == 1:
+        return 1 if _find_replace(hwp, "RepeatFind", search_text) else 0
+
+    for i in range(nth):
+        if not _find_replace(hwp, "RepeatFind", search_text):
+            return i
+    return nth
+
+
+@_hwp_tool()
 def insert_after_text(search_text: str, new_text: str, nth_occurrence: int = 1) -> str:
     """
     특정 텍스트를 찾아서 그 뒤에 새 텍스트를 삽입합니다.
@@ -1968,49 +2690,36 @@ def insert_after_text(search_text: str, new_text: str, nth_occurrence: int = 1)
     nth_occurrence: 몇 번째 발견된 텍스트 뒤에 삽입할지 (1부터 시작, 기본값 1)
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         if not search_text:
             return "찾을 텍스트를 지정해주세요."
 
-        # 문서 시작으로 이동
-        hwp.HAction.Run("MoveDocBegin")
-
-        # n번째 발견까지 반복 검색
-        found_count = 0
-        for i in range(nth_occurrence):
-            hwp.HAction.GetDefault("RepeatFind", hwp.HParameterSet.HFindReplace.HSet)
-            hwp.HParameterSet.HFindReplace.FindString = search_text
+        # 검색할 때마다 화면이 따라 움직이지 않도록 화면 업데이트를 끈 채로 실행
+        with _fast_mode(hwp):
+            # 문서 처음부터 n번째 발견까지 검색
+            found_count = _find_nth(hwp, search_text, nth_occurrence)
 
-            result = hwp.HAction.Execute("RepeatFind", hwp.HParameterSet.HFindReplace.HSet)
-
-            if not result:
-                if i == 0:
-                    return f"'{search_text}'를 찾을 수 없습니다."
-                else:
-                    return f"'{search_text}'를 {i}번만 찾았습니다. ({nth_occurrence}번째를 요청했으나 존재하지 않음)"
+            if found_count == 0:
+                return f"'{search_text}'를 찾을 수 없습니다."
+            if found_count < nth_occurrence:
+                return f"'{search_text}'를 {found_count}번만 찾았습니다. ({nth_occurrence}번째를 요청했으나 존재하지 않음)"
 
-            found_count = i + 1
+            # 찾은 텍스트의 끝으로 이동 (선택 영역의 오른쪽)
+            hwp.HAction.Run("MoveSelRight")
 
-        # 찾은 텍스트의 끝으로 이동 (선택 영역의 오른쪽)
-        hwp.HAction.Run("MoveSelRight")
+            # 새 텍스트 삽입
+            _invoke_action(hwp, "InsertText", Text=new_text)
 
-        # 새 텍스트 삽입
-        act = hwp.CreateAction("InsertText")
-        pset = act.CreateSet()
-        pset.SetItem("Text", new_text)
-        act.Execute(pset)
-
-        logger.info(f"'{search_text}' ({nth_occurrence}번째) 뒤에 '{new_text}' 삽입 완료")
+        logger.info("'%s' (%s번째) 뒤에 '%s' 삽입 완료", search_text, nth_occurrence, new_text)
         return f"'{search_text}' ({nth_occurrence}번째) 뒤에 '{new_text}'를 삽입했습니다."
 
     except Exception as e:
-        logger.error(f"텍스트 뒤 삽입 실패: {e}")
+        logger.error("텍스트 뒤 삽입 실패: %s", e)
         return f"텍스트 뒤 삽입 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool()
 def insert_before_text(search_text: str, new_text: str, nth_occurrence: int = 1) -> str:
     """
     특정 텍스트를 찾아서 그 앞에 새 텍스트를 삽입합니다.
@@ -2019,49 +2728,36 @@ def insert_before_text(search_text: str, new_text: str, nth_occurrence: int = 1)
     nth_occurrence: 몇 번째 발견된 텍스트 앞에 삽입할지 (1부터 시작, 기본값 1)
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         if not search_text:
             return "찾을 텍스트를 지정해주세요."
 
-        # 문서 시작으로 이동
-        hwp.HAction.Run("MoveDocBegin")
-
-        # n번째 발견까지 반복 검색
-        found_count = 0
-        for i in range(nth_occurrence):
-            hwp.HAction.GetDefault("RepeatFind", hwp.HParameterSet.HFindReplace.HSet)
-            hwp.HParameterSet.HFindReplace.FindString = search_text
-
-            result = hwp.HAction.Execute("RepeatFind", hwp.HParameterSet.HFindReplace.HSet)
+        # 검색할 때마다 화면이 따라 움직이지 않도록 화면 업데이트를 끈 채로 실행
+        with _fast_mode(hwp):
+            # 문서 처음부터 n번째 발견까지 검색
+            found_count = _find_nth(hwp, search_text, nth_occurrence)
 
-            if not result:
-                if i == 0:
-                    return f"'{search_text}'를 찾을 수 없습니다."
-                else:
-                    return f"'{search_text}'를 {i}번만 찾았습니다. ({nth_occurrence}번째를 요청했으나 존재하지 않음)"
-
-            found_count = i + 1
+            if found_count == 0:
+                return f"'{search_text}'를 찾을 수 없습니다."
+            if found_count < nth_occurrence:
+                return f"'{search_text}'를 {found_count}번만 찾았습니다. ({nth_occurrence}번째를 요청했으나 존재하지 않음)"
 
-        # 찾은 텍스트의 시작으로 이동 (선택 영역의 왼쪽)
-        hwp.HAction.Run("MoveSelLeft")
+            # 찾은 텍스트의 시작으로 이동 (선택 영역의 왼쪽)
+            hwp.HAction.Run("MoveSelLeft")
 
-        # 새 텍스트 삽입
-        act = hwp.CreateAction("InsertText")
-        pset = act.CreateSet()
-        pset.SetItem("Text", new_text)
-        act.Execute(pset)
+            # 새 텍스트 삽입
+            _invoke_action(hwp, "InsertText", Text=new_text)
 
-        logger.info(f"'{search_text}' ({nth_occurrence}번째) 앞에 '{new_text}' 삽입 완료")
+        logger.info("'%s' (%s번째) 앞에 '%s' 삽입 완료", search_text, nth_occurrence, new_text)
         return f"'{search_text}' ({nth_occurrence}번째) 앞에 '{new_text}'를 삽입했습니다."
 
     except Exception as e:
-        logger.error(f"텍스트 앞 삽입 실패: {e}")
+        logger.error("텍스트 앞 삽입 실패: %s", e)
         return f"텍스트 앞 삽입 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool()
 def append_to_paragraph(paragraph_number: int, text: str) -> str:
     """
     특정 문단의 끝에 텍스트를 추가합니다.
@@ -2069,32 +2765,27 @@ def append_to_paragraph(paragraph_number: int, text: str) -> str:
     text: 추가할 텍스트
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         # 문단으로 이동
-        hwp.HAction.Run("MoveDocBegin")
-        for i in range(paragraph_number):
-            hwp.HAction.Run("MoveParaDown")
+        if not _goto_paragraph(hwp, paragraph_number):
+            return f"{paragraph_number}번째 문단을 찾을 수 없습니다."
 
         # 문단 끝으로 이동
         hwp.HAction.Run("MoveParaEnd")
 
         # 텍스트 삽입
-        act = hwp.CreateAction("InsertText")
-        pset = act.CreateSet()
-        pset.SetItem("Text", text)
-        act.Execute(pset)
+        _invoke_action(hwp, "InsertText", Text=text)
 
-        logger.info(f"{paragraph_number}번째 문단 끝에 텍스트 추가 완료")
+        logger.info("%s번째 문단 끝에 텍스트 추가 완료", paragraph_number)
         return f"{paragraph_number}번째 문단 끝에 '{text[:30]}...'를 추가했습니다."
 
     except Exception as e:
-        logger.error(f"문단 끝 추가 실패: {e}")
+        logger.error("문단 끝 추가 실패: %s", e)
         return f"문단 끝 추가 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool()
 def prepend_to_paragraph(paragraph_number: int, text: str) -> str:
     """
     특정 문단의 앞에 텍스트를 추가합니다.
@@ -2102,30 +2793,25 @@ def prepend_to_paragraph(paragraph_number: int, text: str) -> str:
     text: 추가할 텍스트
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         # 문단으로 이동
-        hwp.HAction.Run("MoveDocBegin")
-        for i in range(paragraph_number):
-            hwp.HAction.Run("MoveParaDown")
+        if not _goto_paragraph(hwp, paragraph_number):
+            return f"{paragraph_number}번째 문단을 찾을 수 없습니다."
 
         # 문단 시작으로 이동 (이미 시작 위치)
         # 텍스트 삽입
-        act = hwp.CreateAction("InsertText")
-        pset = act.CreateSet()
-        pset.SetItem("Text", text)
-        act.Execute(pset)
+        _invoke_action(hwp, "InsertText", Text=text)
 
-        logger.info(f"{paragraph_number}번째 문단 앞에 텍스트 추가 완료")
+        logger.info("%s번째 문단 앞에 텍스트 추가 완료", paragraph_number)
         return f"{paragraph_number}번째 문단 앞에 '{text[:30]}...'를 추가했습니다."
 
     except Exception as e:
-        logger.error(f"문단 앞 추가 실패: {e}")
+        logger.error("문단 앞 추가 실패: %s", e)
         return f"문단 앞 추가 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool()
 def insert_at_page_start(page_number: int, text: str) -> str:
     """
     특정 페이지의 시작 부분에 텍스트를 삽입합니다.
@@ -2133,36 +2819,30 @@ def insert_at_page_start(page_number: int, text: str) -> str:
     text: 삽입할 텍스트
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
-        total_pages = hwp.PageCount
+        total_pages = _page_count(hwp)
         if page_number < 1 or page_number > total_pages:
             return f"페이지 번호가 범위를 벗어났습니다. (1~{total_pages})"
 
         # 페이지로 이동
-        hwp.HAction.GetDefault("Goto", hwp.HParameterSet.HGotoE.HSet)
-        hwp.HParameterSet.HGotoE.PageNumber = page_number
-        hwp.HAction.Execute("Goto", hwp.HParameterSet.HGotoE.HSet)
+        _goto_page(hwp, page_number)
 
         # 페이지 시작으로 이동
         hwp.HAction.Run("MovePageBegin")
 
         # 텍스트 삽입
-        act = hwp.CreateAction("InsertText")
-        pset = act.CreateSet()
-        pset.SetItem("Text", text)
-        act.Execute(pset)
+        _invoke_action(hwp, "InsertText", Text=text)
 
-        logger.info(f"{page_number}페이지 시작에 텍스트 삽입 완료")
+        logger.info("%s페이지 시작에 텍스트 삽입 완료", page_number)
         return f"{page_number}페이지 시작에 '{text[:30]}...'를 삽입했습니다."
 
     except Exception as e:
-        logger.error(f"페이지 시작 삽입 실패: {e}")
+        logger.error("페이지 시작 삽입 실패: %s", e)
         return f"페이지 시작 삽입 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool()
 def insert_at_page_end(page_number: int, text: str) -> str:
     """
     특정 페이지의 끝 부분에 텍스트를 삽입합니다.
@@ -2170,32 +2850,26 @@ def insert_at_page_end(page_number: int, text: str) -> str:
     text: 삽입할 텍스트
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
-        total_pages = hwp.PageCount
+        total_pages = _page_count(hwp)
         if page_number < 1 or page_number > total_pages:
             return f"페이지 번호가 범위를 벗어났습니다. (1~{total_pages})"
 
         # 페이지로 이동
-        hwp.HAction.GetDefault("Goto", hwp.HParameterSet.HGotoE.HSet)
-        hwp.HParameterSet.HGotoE.PageNumber = page_number
-        hwp.HAction.Execute("Goto", hwp.HParameterSet.HGotoE.HSet)
+        _goto_page(hwp, page_number)
 
         # 페이지 끝으로 이동
         hwp.HAction.Run("MovePageEnd")
 
         # 텍스트 삽입
-        act = hwp.CreateAction("InsertText")
-        pset = act.CreateSet()
-        pset.SetItem("Text", text)
-        act.Execute(pset)
+        _invoke_action(hwp, "InsertText", Text=text)
 
-        logger.info(f"{page_number}페이지 끝에 텍스트 삽입 완료")
+        logger.info("%s페이지 끝에 텍스트 삽입 완료", page_number)
         return f"{page_number}페이지 끝에 '{text[:30]}...'를 삽입했습니다."
 
     except Exception as e:
-        logger.error(f"페이지 끝 삽입 실패: {e}")
+        logger.error("페이지 끝 삽입 실패: %s", e)
         return f"페이지 끝 삽입 실패: {e}"
 
 
@@ -2203,20 +2877,18 @@ def insert_at_page_end(page_number: int, text: str) -> str:
 # 선택 기능
 # ============================================================
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def select_paragraph_by_number(paragraph_number: int) -> str:
     """
     특정 문단을 선택합니다.
     paragraph_number: 선택할 문단 번호 (0부터 시작)
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         # 문단으로 이동
-        hwp.HAction.Run("MoveDocBegin")
-        for i in range(paragraph_number):
-            hwp.HAction.Run("MoveParaDown")
+        if not _goto_paragraph(hwp, paragraph_number):
+            return f"{paragraph_number}번째 문단을 찾을 수 없습니다."
 
         # 문단 선택
         hwp.HAction.Run("MoveSelParaDown")
@@ -2226,48 +2898,52 @@ def select_paragraph_by_number(paragraph_number: int) -> str:
         if selected_text is None:
             selected_text = ""
 
-        logger.info(f"{paragraph_number}번째 문단 선택 완료")
+        logger.info("%s번째 문단 선택 완료", paragraph_number)
         return f"{paragraph_number}번째 문단을 선택했습니다. ({len(selected_text)}자)"
 
     except Exception as e:
-        logger.error(f"문단 선택 실패: {e}")
+        logger.error("문단 선택 실패: %s", e)
         return f"문단 선택 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool(readonly=True)
 def select_page_content(page_number: int) -> str:
     """
     특정 페이지의 모든 내용을 선택합니다.
+    결과에는 선택이 걸친 문단의 대략적인 수를 알려줍니다. (이전 버전의 글자 수 대신)
+    페이지 경계에서 일부만 선택된 문단도 하나로 세며, 선택 양 끝이 표 셀 등 서로 다른 영역에 있으면 생략합니다.
     page_number: 선택할 페이지 번호 (1부터 시작)
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
-        total_pages = hwp.PageCount
+        total_pages = _page_count(hwp)
         if page_number < 1 or page_number > total_pages:
             return f"페이지 번호가 범위를 벗어났습니다. (1~{total_pages})"
 
         # 페이지로 이동
-        hwp.HAction.GetDefault("Goto", hwp.HParameterSet.HGotoE.HSet)
-        hwp.HParameterSet.HGotoE.PageNumber = page_number
-        hwp.HAction.Execute("Goto", hwp.HParameterSet.HGotoE.HSet)
+        _goto_page(hwp, page_number)
 
+        run = hwp.HAction.Run
         # 페이지 시작으로 이동
-        hwp.HAction.Run("MovePageBegin")
+        run("MovePageBegin")
         # 페이지 전체 선택
-        hwp.HAction.Run("MoveSelPageDown")
+        run("MoveSelPageDown")
 
-        # 선택된 내용 확인
-        selected_text = hwp.GetTextFile("TEXT", "")
-        if selected_text is None:
-            selected_text = ""
+        # 선택 범위 확인 (텍스트를 꺼내지 않고 선택 양 끝 위치만 읽음)
+        # 위치 값으로는 글자 수를 알 수 없으므로 선택이 걸친 문단 수만 대략 알려줌
+        # 문단 번호는 리스트마다 따로 매겨지므로 양 끝이 같은 리스트일 때만 비교할 수 있음
+        _, start_list, start_para, _, end_list, end_para, end_pos = hwp.GetSelectedPos()
+
+        logger.info("%s페이지 선택 완료", page_number)
+        if start_list != end_list:
+            return f"{page_number}페이지를 선택했습니다."
 
-        logger.info(f"{page_number}페이지 선택 완료")
-        return f"{page_number}페이지를 선택했습니다. ({len(selected_text)}자)"
+        para_span = end_para - start_para + (1 if end_pos else 0)
+        return f"{page_number}페이지를 선택했습니다. (약 {para_span}개 문단에 걸침, 글자 수 아님)"
 
     except Exception as e:
-        logger.error(f"페이지 선택 실패: {e}")
+        logger.error("페이지 선택 실패: %s", e)
         return f"페이지 선택 실패: {e}"
 
 
@@ -2275,7 +2951,7 @@ def select_page_content(page_number: int) -> str:
 # 성능 최적화 및 자동화 제어
 # ============================================================
 
-@mcp.tool()
+@_hwp_tool()
 def set_screen_updating(enabled: bool = True) -> str:
     """
     화면 업데이트를 켜거나 끕니다.
@@ -2285,24 +2961,25 @@ def set_screen_updating(enabled: bool = True) -> str:
     enabled: True=화면 업데이트 켜기, False=화면 업데이트 끄기
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         if enabled:
             hwp.SetScreenUpdate(1)  # 화면 업데이트 켜기
+            hwp_controller.screen_update_enabled = True
             logger.info("화면 업데이트 활성화")
             return "화면 업데이트를 활성화했습니다. (정상 속도)"
         else:
             hwp.SetScreenUpdate(0)  # 화면 업데이트 끄기
+            hwp_controller.screen_update_enabled = False
             logger.info("화면 업데이트 비활성화")
             return "화면 업데이트를 비활성화했습니다. (고속 모드)"
 
     except Exception as e:
-        logger.error(f"화면 업데이트 설정 실패: {e}")
+        logger.error("화면 업데이트 설정 실패: %s", e)
         return f"화면 업데이트 설정 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool()
 def set_automation_mode(enabled: bool = True) -> str:
     """
     자동화 모드를 켜거나 끕니다.
@@ -2311,40 +2988,28 @@ def set_automation_mode(enabled: bool = True) -> str:
     enabled: True=자동화 모드 (대화상자 없음), False=일반 모드 (대화상자 표시)
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         if enabled:
             # 자동화 모드 활성화
-            try:
-                hwp.MessageBoxMode = 0  # 0=자동응답
-            except:
-                pass
-            try:
-                hwp.SetMessageBoxMode(0)
-            except:
-                pass
+            _set_message_box_mode(hwp, 0)  # 0=자동응답
             logger.info("자동화 모드 활성화")
             return "자동화 모드를 활성화했습니다. (모든 확인창 자동 승인)"
         else:
             # 일반 모드로 전환
-            try:
-                hwp.MessageBoxMode = 1  # 1=대화상자표시
-            except:
-                pass
-            try:
-                hwp.SetMessageBoxMode(1)
-            except:
-                pass
+            _set_message_box_mode(hwp, 1)  # 1=대화상자표시
             logger.info("일반 모드 활성화")
             return "일반 모드로 전환했습니다. (확인창 표시)"
 
     except Exception as e:
-        logger.error(f"자동화 모드 설정 실패: {e}")
+        logger.error("자동화 모드 설정 실패: %s", e)
         return f"자동화 모드 설정 실패: {e}"
 
 
-@mcp.tool()
+# optimize_for_bulk_operations를 실행했을 때의 문서 리비전 (restore_normal_mode의 다시 쪽 맞춤 판단용)
+_bulk_mode_rev = None
+
+@_hwp_tool()
 def optimize_for_bulk_operations() -> str:
     """
     대량 작업을 위한 최적화 설정을 적용합니다.
@@ -2354,50 +3019,66 @@ def optimize_for_bulk_operations() -> str:
 
     작업 완료 후 restore_normal_mode()를 호출하세요.
     """
+    global _bulk_mode_rev
+
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
+
+        _bulk_mode_rev = _doc_rev
+
+        # 설정마다 따로 적용하고, 실패한 설정은 결과에 알림
+        failed = []
 
         # 화면 업데이트 끄기
         try:
             hwp.SetScreenUpdate(0)
-        except:
-            pass
+            hwp_controller.screen_update_enabled = False
+        except Exception as e:
+            logger.warning("화면 업데이트 끄기 실패: %s", e)
+            failed.append("화면 업데이트 끄기")
 
         # 자동화 모드 켜기
         try:
-            hwp.MessageBoxMode = 0
-        except:
-            pass
+            _set_message_box_mode(hwp, 0)
+        except Exception as e:
+            logger.warning("자동화 모드 설정 실패: %s", e)
+            failed.append("자동화 모드")
 
         # 자동 저장 비활성화 (성능 향상)
         try:
             hwp.SetAutoSave(0)
-        except:
-            pass
+        except Exception as e:
+            logger.warning("자동 저장 끄기 실패: %s", e)
+            failed.append("자동 저장 끄기")
+
+        if failed:
+            logger.info("대량 작업 최적화 모드 일부 활성화 (실패: %s)", ", ".join(failed))
+            return f"대량 작업 최적화 모드를 일부만 활성화했습니다. (적용 실패: {', '.join(failed)})\n작업 완료 후 restore_normal_mode()를 호출하세요."
 
         logger.info("대량 작업 최적화 모드 활성화")
         return "대량 작업 최적화 모드를 활성화했습니다. (최고 성능)\n작업 완료 후 restore_normal_mode()를 호출하세요."
 
     except Exception as e:
-        logger.error(f"최적화 모드 설정 실패: {e}")
+        logger.error("최적화 모드 설정 실패: %s", e)
         return f"최적화 모드 설정 실패: {e}"
 
 
-@mcp.tool()
+@_hwp_tool()
 def restore_normal_mode() -> str:
     """
     최적화 설정을 해제하고 일반 모드로 복원합니다.
     - 화면 업데이트 활성화
     - 자동 저장 활성화
     """
+    global _bulk_mode_rev
+
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         # 화면 업데이트 켜기
         try:
             hwp.SetScreenUpdate(1)
+            hwp_controller.screen_update_enabled = True
         except:
             pass
 
@@ -2407,58 +3088,61 @@ def restore_normal_mode() -> str:
         except:
             pass
 
-        # 화면 갱신
-        try:
-            hwp.Run("Repaginate")
-        except:
-            pass
+        # 화면 갱신: 최적화 모드 이후 문서를 바꾸는 도구가 실행되지 않았다면 생략
+        # (이 도구 자신의 호출로 리비전이 정확히 1 증가한 경우만 변경 없음으로 판단)
+        if _bulk_mode_rev is None or _doc_rev != _bulk_mode_rev + 1:
+            try:
+                hwp.Run("Repaginate")
+            except:
+                pass
+        _bulk_mode_rev = None
 
         logger.info("일반 모드 복원 완료")
         return "일반 모드로 복원했습니다. (화면 업데이트 활성화)"
 
     except Exception as e:
-        logger.error(f"일반 모드 복원 실패: {e}")
+        logger.error("일반 모드 복원 실패: %s", e)
         return f"일반 모드 복원 실패: {e}"
 
 
-@mcp.tool()
-def replace_paragraph(paragraph_number: int, new_text: str) -> str:
+@_hwp_tool()
+def replace_paragraph(paragraph_number: int, new_text: str, show_previous: bool = True) -> str:
     """
     특정 문단의 내용을 완전히 새 텍스트로 교체합니다.
     paragraph_number: 교체할 문단 번호 (0부터 시작)
     new_text: 새로운 텍스트
+    show_previous: 교체 전 내용(앞 50자)도 함께 보여줍니다. False면 교체 전 문단 텍스트를 읽지 않습니다.
     """
     try:
-        hwp_controller.check_initialization()
-        hwp = hwp_controller.hwp
+        hwp = _require_hwp()
 
         # 문단으로 이동
-        hwp.HAction.Run("MoveDocBegin")
-        for i in range(paragraph_number):
-            hwp.HAction.Run("MoveParaDown")
+        if not _goto_paragraph(hwp, paragraph_number):
+            return f"{paragraph_number}번째 문단을 찾을 수 없습니다."
 
         # 문단 선택
         hwp.HAction.Run("MoveSelParaDown")
 
-        # 기존 내용 확인
-        old_text = hwp.GetTextFile("TEXT", "")
-        if old_text is None:
-            old_text = ""
+        # 기존 내용 확인 (요청한 경우에만 선택 영역을 텍스트로 가져옴)
+        if show_previous:
+            old_text = hwp.GetTextFile("TEXT", "")
+            if old_text is None:
+                old_text = ""
 
         # 삭제
         hwp.HAction.Run("Delete")
 
         # 새 텍스트 삽입
-        act = hwp.CreateAction("InsertText")
-        pset = act.CreateSet()
-        pset.SetItem("Text", new_text)
-        act.Execute(pset)
+        _invoke_action(hwp, "InsertText", Text=new_text)
 
-        logger.info(f"{paragraph_number}번째 문단 교체 완료")
-        return f"{paragraph_number}번째 문단을 교체했습니다.\n이전: {old_text[:50] if old_text else '(빈 문단)'}...\n새 내용: {new_text[:50]}..."
+        logger.info("%s번째 문단 교체 완료", paragraph_number)
+        result = f"{paragraph_number}번째 문단을 교체했습니다."
+        if show_previous:
+            result += f"\n이전: {old_text[:50] if old_text else '(빈 문단)'}..."
+        return result + f"\n새 내용: {new_text[:50]}..."
 
     except Exception as e:
-        logger.error(f"문단 교체 실패: {e}")
+        logger.error("문단 교체 실패: %s", e)
         return f"문단 교체 실패: {e}"
 
 
@@ -2470,8 +3154,10 @@ def main():
         mcp.run()
         
     except Exception as e:
-        logger.error(f"서버 실행 중 오류: {e}")
+        logger.error("서버 실행 중 오류: %s", e)
         sys.exit(1)
+    finally:
+        hwp_controller.shutdown()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+한글 문서 텍스트 처리 함수
+GetTextFile로 가져온 문서 텍스트(줄바꿈은 \r\n)를 다루는 순수 파이썬 함수 모음입니다.
+한글 COM 없이 동작하므로 Windows가 아닌 환경에서도 테스트할 수 있습니다.
+"""
+
+import bisect
+import re
+
+_CRLF_RE = re.compile('\r\n')
+
+def find_positions(full_text, search_text):
+    """
+    full_text에서 search_text가 나오는 모든 위치를 (오프셋, 줄 번호) 목록으로 반환합니다.
+    대소문자를 무시하고 겹치는 위치까지 모두 찾으며, 줄 번호는 1부터 셉니다.
+    줄바꿈(\r\n) 위에 있는 위치는 그 줄바꿈으로 끝나는 줄에 속합니다.
+    """
+    # 겹치는 위치까지 모두 찾도록 전방탐색 사용 (대소문자 무시, 소문자 사본을 만들지 않음)
+    pattern = re.compile(f"(?={re.escape(search_text)})", re.IGNORECASE)
+    positions = [m.start() for m in pattern.finditer(full_text)]
+    if not positions:
+        return []
+
+    # 각 줄의 시작 오프셋 - 위치가 속한 줄은 이진 탐색으로 찾음
+    # (split으로 문서 전체를 줄 단위로 복사하지 않고 줄바꿈 위치만 모음)
+    line_starts = [0]
+    line_starts.extend(m.end() for m in _CRLF_RE.finditer(full_text))
+
+    return [(pos, bisect.bisect_right(line_starts, pos)) for pos in positions]
+
+def multi_replace(full_text, mapping):
+    """
+    mapping의 검색어를 모두 한 번의 정규식 치환으로 바꾸고 (바뀐 텍스트, 검색어별 바꾼 횟수)를 반환합니다.
+    긴 검색어를 먼저 맞추며, 바뀐 결과가 다른 검색어에 다시 바뀌지 않습니다.
+    """
+    hits = dict.fromkeys(mapping, 0)
+    if not mapping:
+        return full_text, hits
+
+    def _replace(match):
+        key = match.group(0)
+        hits[key] += 1
+        return mapping[key]
+
+    # 긴 검색어를 먼저 두어 짧은 검색어가 접두어로 가로채지 않도록 함
+    pattern = re.compile('|'.join(re.escape(k) for k in sorted(mapping, key=len, reverse=True)))
+    return pattern.sub(_replace, full_text), hits
+
+# 제목/개요 판별 패턴: (정규식, 수준, 종류)
+HEADING_PATTERNS = tuple((re.compile(pattern), level, ptype) for pattern, level, ptype in (
+    (r'^\s*([IVX]+)\.\s*(.+)$', 1, "로마자"),
+    (r'^\s*(\d+)\.\s*(.+)$', 2, "숫자"),
+    (r'^\s*([가-힣])\.\s*(.+)$', 3, "가나다"),
+    (r'^\s*\((\d+)\)\s*(.+)$', 3, "괄호숫자"),
+    (r'^\s*(제\s*\d+\s*[장절조항])\s*(.*)$', 1, "장절"),
+    (r'^\s*(붙임|별첨|부록)\s*[\d]*\.?\s*(.*)$', 1, "붙임"),
+))
+
+def scan_headings(full_text):
+    """문서 앞쪽 200줄에서 번호 체계로 시작하는 제목/개요 줄을 찾습니다."""
+    # 제목은 앞쪽 200줄에서만 찾으므로 그 부분만 줄 단위로 나눔
+    head_end = -2
+    for _ in range(200):
+        head_end = full_text.find('\r\n', head_end + 2)
+        if head_end == -1:
+            break
+    head = full_text[:head_end] if head_end >= 0 else full_text
+
+    headings = []
+    lines = head.split('\r\n') if head else []
+
+    for i, line in enumerate(lines):
+        line_stripped = line.strip()
+        if not line_stripped or len(line_stripped) > 100:
+            continue
+
+        # 어떤 패턴도 시작할 수 없는 첫 글자면 정규식을 돌리지 않음
+        first = line_stripped[0]
+        if not (first in "IVX(" or first.isdigit() or '가' <= first <= '힣'):
+            continue
+
+        for pattern, level, ptype in HEADING_PATTERNS:
+            if pattern.match(line_stripped):
+                headings.append({
+                    "line": i + 1,
+                    "level": level,
+                    "text": line_stripped[:60] + ("..." if len(line_stripped) > 60 else ""),
+                    "type": ptype
+                })
+                break
+
+    return headings
+
+def text_stats(full_text):
+    """(공백/줄바꿈을 뺀 글자 수, 문단 수)를 반환합니다. 문단 수는 줄바꿈(\r\n) 수로 추정합니다."""
+    # 공백/줄바꿈을 지운 사본을 만들지 않고 개수만 세어 계산
+    line_breaks = full_text.count('\r\n')
+    char_count = len(full_text) - full_text.count(' ') - 2 * line_breaks
+    paragraph_count = line_breaks + 1 if full_text else 0
+    return char_count, paragraph_count
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+hwp_text 텍스트 처리 함수 테스트
+한글 COM 없이 실행됩니다: python -m unittest test_hwp_text
+기존 도구 코드의 계산 방식을 그대로 옮긴 기준 구현과 결과를 비교합니다.
+"""
+
+import re
+import unittest
+
+from hwp_text import HEADING_PATTERNS, find_positions, multi_replace, scan_headings, text_stats
+
+
+def _reference_find_positions(full_text, search_text):
+    """기존 find_text의 방식: 소문자 사본에서 한 글자씩 밀며 찾고 줄 목록을 앞에서부터 훑어 줄 번호를 구함"""
+    search_lower = search_text.lower()
+    text_lower = full_text.lower()
+
+    positions = []
+    start = 0
+    while True:
+        pos = text_lower.find(search_lower, start)
+        if pos == -1:
+            break
+        positions.append(pos)
+        start = pos + 1
+
+    lines = full_text.split('\r\n')
+    result = []
+    for pos in positions:
+        current_pos = 0
+        line_num = 0
+        for idx, line in enumerate(lines):
+            line_end = current_pos + len(line)
+            if current_pos <= pos < line_end + 2:
+                line_num = idx + 1
+                break
+            current_pos = line_end + 2
+        result.append((pos, line_num))
+    return result
+
+
+def _reference_scan_headings(full_text):
+    """기존 get_document_structure의 방식: 전체를 줄로 나눠 앞 200줄의 모든 줄에 패턴을 차례로 적용"""
+    headings = []
+    lines = full_text.split('\r\n') if full_text else []
+    for i, line in enumerate(lines[:200]):
+        line_stripped = line.strip()
+        if not line_stripped or len(line_stripped) > 100:
+            continue
+        for pattern, level, ptype in HEADING_PATTERNS:
+            if re.match(pattern.pattern, line_stripped):
+                headings.append({
+                    "line": i + 1,
+                    "level": level,
+                    "text": line_stripped[:60] + ("..." if len(line_stripped) > 60 else ""),
+                    "type": ptype
+                })
+                break
+    return headings
+
+
+def _reference_text_stats(full_text):
+    """기존 get_document_structure의 방식: 줄바꿈과 공백을 지운 사본의 길이"""
+    char_count = len(full_text.replace('\r\n', '').replace(' ', '')) if full_text else 0
+    paragraph_count = full_text.count('\r\n') + 1 if full_text else 0
+    return char_count, paragraph_count
+
+
+class FindPositionsTest(unittest.TestCase):
+
+    def test_overlapping_matches(self):
+        self.assertEqual(find_positions("aaaa", "aa"), [(0, 1), (1, 1), (2, 1)])
+
+    def test_ignores_case(self):
+        self.assertEqual(find_positions("HWP hwp Hwp", "hwp"), [(0, 1), (4, 1), (8, 1)])
+
+    def test_not_found(self):
+        self.assertEqual(find_positions("첫 줄\r\n둘째 줄", "셋째"), [])
+
+    def test_line_numbers_at_crlf_boundaries(self):
+        text = "ab\r\ncd\r\n\r\nef"
+        # 줄바꿈 문자 위의 위치는 그 줄바꿈으로 끝나는 줄에 속함
+        self.assertEqual(find_positions(text, "\r"), [(2, 1), (6, 2), (8, 3)])
+        self.assertEqual(find_positions(text, "\n"), [(3, 1), (7, 2), (9, 3)])
+        # 줄 첫 글자는 다음 줄
+        self.assertEqual(find_positions(text, "c"), [(4, 2)])
+        self.assertEqual(find_positions(text, "e"), [(10, 4)])
+        # 줄바꿈을 가로지르는 검색어는 시작 위치의 줄
+        self.assertEqual(find_positions(text, "b\r\nc"), [(1, 1)])
+
+    def test_matches_reference(self):
+        cases = [
+            ("aaaa", "aa"),
+            ("가나다\r\n가나\r\n\r\n다가나다", "가나"),
+            ("ab\r\ncd\r\n\r\nef", "\r\n"),
+            ("\r\n\r\n\r\n", "\n\r"),
+            ("Report REPORT report\r\nrePort", "report"),
+            ("제1장 총칙\r\n제2장 제2조", "제"),
+            ("끝에 있는 검색어", "검색어"),
+        ]
+        for text, search in cases:
+            with self.subTest(text=text, search=search):
+                self.assertEqual(find_positions(text, search), _reference_find_positions(text, search))
+
+
+class MultiReplaceTest(unittest.TestCase):
+
+    def test_counts_per_key(self):
+        new_text, hits = multi_replace("2023년 주식회사 2023년", {"2023년": "2024년", "주식회사": "㈜", "홍길동": "김철수"})
+        self.assertEqual(new_text, "2024년 ㈜ 2024년")
+        self.assertEqual(hits, {"2023년": 2, "주식회사": 1, "홍길동": 0})
+
+    def test_longer_key_wins_regardless_of_order(self):
+        for mapping in ({"주식": "A", "주식회사": "B"}, {"주식회사": "B", "주식": "A"}):
+            with self.subTest(mapping=mapping):
+                new_text, hits = multi_replace("주식회사 주식", mapping)
+                self.assertEqual(new_text, "B A")
+                self.assertEqual(hits, {"주식": 1, "주식회사": 1})
+
+    def test_replacements_are_not_replaced_again(self):
+        # 순서대로 바꾸면 a->b 다음 b->c가 다시 바꾸지만, 한 번의 치환에서는 원래 텍스트만 봄
+        new_text, hits = multi_replace("ab", {"a": "b", "b": "c"})
+        self.assertEqual(new_text, "bc")
+        self.assertEqual(hits, {"a": 1, "b": 1})
+
+    def test_non_overlapping_counts(self):
+        new_text, hits = multi_replace("aaaaa", {"aa": "X"})
+        self.assertEqual(new_text, "XXa")
+        self.assertEqual(hits, {"aa": 2})
+
+    def test_empty_mapping(self):
+        self.assertEqual(multi_replace("본문", {}), ("본문", {}))
+
+    def test_matches_sequential_replace_for_independent_keys(self):
+        # 검색어끼리 겹치지 않으면 항목별로 차례로 바꾼 결과와 같아야 함
+        text = "주식회사 홍길동\r\n2023년 결산\r\n홍길동 2023년"
+        mapping = {"주식회사": "㈜", "2023년": "2024년", "홍길동": "김철수"}
+        expected = text
+        for key, value in mapping.items():
+            expected = expected.replace(key, value)
+        new_text, hits = multi_replace(text, mapping)
+        self.assertEqual(new_text, expected)
+        self.assertEqual(hits, {key: text.count(key) for key in mapping})
+
+
+class ScanHeadingsTest(unittest.TestCase):
+
+    SAMPLE_LINES = [
+        "I. 개요",
+        "  1. 목적",
+        "가. 세부 내용",
+        "(1) 첫째 항목",
+        "제 3 장 총칙",
+        "제2조(정의)",
+        "붙임 1. 관련 서식",
+        "별첨",
+        "부록 참고 자료",
+        "본문 문장입니다.",
+        "1.5배 증가",
+        "XIV. 로마자 머리",
+        "IVX",
+        "(가) 괄호 한글",
+        "１. 전각 숫자",
+        "² 위첨자",
+        "- 글머리표",
+        "※ 참고",
+        "a. 영문 소문자",
+        "",
+        "   ",
+        "2. " + "긴 제목" * 30,
+        "3. " + "육십 자를 넘는 제목" * 6,
+    ]
+
+    def test_pattern_types(self):
+        headings = scan_headings("\r\n".join(self.SAMPLE_LINES))
+        found = {(h["line"], h["type"]) for h in headings}
+        self.assertIn((1, "로마자"), found)
+        self.assertIn((2, "숫자"), found)
+        self.assertIn((3, "가나다"), found)
+        self.assertIn((4, "괄호숫자"), found)
+        self.assertIn((5, "장절"), found)
+        self.assertIn((7, "붙임"), found)
+        # 100자를 넘는 줄은 제목으로 보지 않고, 60자를 넘으면 잘라서 보여줌
+        self.assertNotIn(22, {h["line"] for h in headings})
+        self.assertTrue(headings[-1]["text"].endswith("..."))
+
+    def test_first_character_prefilter_matches_reference(self):
+        text = "\r\n".join(self.SAMPLE_LINES)
+        self.assertEqual(scan_headings(text), _reference_scan_headings(text))
+
+    def test_only_first_200_lines(self):
+        lines = ["본문"] * 250
+        for line_num in (1, 199, 200, 201, 250):
+            lines[line_num - 1] = f"{line_num}. 제목"
+        text = "\r\n".join(lines)
+        headings = scan_headings(text)
+        self.assertEqual([h["line"] for h in headings], [1, 199, 200])
+        self.assertEqual(headings, _reference_scan_headings(text))
+
+    def test_line_count_around_cutoff(self):
+        for count in (0, 1, 199, 200, 201):
+            with self.subTest(count=count):
+                text = "\r\n".join(f"{i}. 제목" for i in range(1, count + 1))
+                self.assertEqual(scan_headings(text), _reference_scan_headings(text))
+        # 빈 줄로 끝나는 문서
+        text = "\r\n".join(["1. 제목"] * 200) + "\r\n"
+        self.assertEqual(scan_headings(text), _reference_scan_headings(text))
+
+    def test_empty_text(self):
+        self.assertEqual(scan_headings(""), [])
+
+
+class TextStatsTest(unittest.TestCase):
+
+    def test_excludes_spaces_and_crlf(self):
+        self.assertEqual(text_stats("가 나\r\n다  라\r\n"), (4, 3))
+
+    def test_keeps_lone_cr_lf_and_other_whitespace(self):
+        # \r\n 쌍과 공백(U+0020)만 빼고 단독 \r, \n, 탭, 전각 공백은 글자로 셈
+        self.assertEqual(text_stats("a\rb\nc\td\u3000e"), (9, 1))
+
+    def test_empty_text(self):
+        self.assertEqual(text_stats(""), (0, 0))
+
+    def test_matches_reference(self):
+        cases = [
+            "",
+            " ",
+            "\r\n",
+            "\r\r\n\n",
+            "\r \n",
+            "  첫 문단\r\n\r\n 둘째 문단 \r\n",
+            "a\rb\nc\td\u3000e",
+            "\n\r\n\r",
+        ]
+        for text in cases:
+            with self.subTest(text=text):
+                self.assertEqual(text_stats(text), _reference_text_stats(text))
+
+
+if __name__ == "__main__":
+    unittest.main()